@@ -10,24 +10,39 @@ Usage:
 """
 
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-
-def generate_icon_png(size: int, output_path: str) -> None:
-    """Generate a TT icon PNG at the specified size."""
-    # Import PyQt6 here so the script fails fast with a clear message
+# Import PyQt6 up front so the script fails fast with a clear message
+try:
     from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont
+    from PyQt6.QtGui import QImage, QPixmap, QPainter, QColor, QFont
     from PyQt6.QtCore import Qt, QRect
+except ImportError:
+    sys.exit("PyQt6 is required to generate the icon: pip install PyQt6")
 
-    # QApplication required for QPainter
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+BACKGROUND_COLOR = QColor(255, 255, 255)
+TEXT_COLOR = QColor(30, 30, 30)
+
+# macOS iconset requires these specific sizes
+ICON_SIZES = [16, 32, 64, 128, 256, 512, 1024]
+
+# Largest pixel size in the iconset (1024 standard / 512@2x); every other
+# size is downscaled from this single render
+MASTER_SIZE = 1024
+
+# QImage.save quality for PNG maps to zlib level (100 - quality) * 9 / 91;
+# 80 gives level 1, trading a little size for a much faster encode of these
+# intermediate files
+PNG_QUALITY = 80
 
+
+def render_icon(size: int) -> QPixmap:
+    """Render the TT icon at the specified size (requires a QApplication)."""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -39,19 +54,60 @@ def generate_icon_png(size: int, output_path: str) -> None:
     corner_radius = max(size // 5, 4)
     margin = max(size // 32, 1)
     painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QColor(255, 255, 255))
+    painter.setBrush(BACKGROUND_COLOR)
     painter.drawRoundedRect(margin, margin, size - 2 * margin, size - 2 * margin,
                             corner_radius, corner_radius)
 
     # TT letters in dark color
     font_size = max(size // 2, 8)
-    font = QFont("Helvetica Neue", font_size, QFont.Weight.Bold)
-    painter.setFont(font)
-    painter.setPen(QColor(30, 30, 30))
+    painter.setFont(QFont("Helvetica Neue", font_size, QFont.Weight.Bold))
+    painter.setPen(TEXT_COLOR)
     painter.drawText(QRect(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, "TT")
 
     painter.end()
-    pixmap.save(output_path, "PNG")
+    return pixmap
+
+
+def iconset_entries(icon_sizes: list[int]) -> list[tuple[str, int]]:
+    """List (filename, pixel size) pairs for a macOS iconset."""
+    entries = []
+    for size in icon_sizes:
+        # Standard resolution
+        entries.append((f"icon_{size}x{size}.png", size))
+
+        # @2x (Retina) for sizes up to 512
+        if size <= 512:
+            entries.append((f"icon_{size}x{size}@2x.png", size * 2))
+    return entries
+
+
+def scale_icon(master: QImage, size: int) -> QImage:
+    """Downscale the master render to the requested pixel size."""
+    if size == master.width():
+        return master
+    return master.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+
+
+def group_by_size(entries: list[tuple[str, int]]) -> dict[int, list[str]]:
+    """Group iconset filenames by pixel size (e.g. 256 -> 256x256 and 128x128@2x)."""
+    groups: dict[int, list[str]] = {}
+    for filename, size in entries:
+        groups.setdefault(size, []).append(filename)
+    return groups
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link an already-encoded PNG, falling back to a copy."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def write_icon(master: QImage, size: int, output_path: Path) -> bool:
+    """Scale and PNG-encode one iconset entry (safe to run on a worker thread)."""
+    return scale_icon(master, size).save(str(output_path), "PNG", PNG_QUALITY)
 
 
 def main():
@@ -59,23 +115,32 @@ def main():
     resources_dir = project_root / "resources"
     resources_dir.mkdir(exist_ok=True)
 
-    # macOS iconset requires these specific sizes
-    icon_sizes = [16, 32, 64, 128, 256, 512, 1024]
+    # QApplication required for QPainter
+    app = QApplication.instance() or QApplication(sys.argv)
 
     with tempfile.TemporaryDirectory() as tmpdir:
         iconset_dir = Path(tmpdir) / "TommyTalker.iconset"
         iconset_dir.mkdir()
 
-        for size in icon_sizes:
-            # Standard resolution
-            filename = f"icon_{size}x{size}.png"
-            generate_icon_png(size, str(iconset_dir / filename))
+        # Rasterize the glyph once, then downscale and encode each distinct
+        # pixel size in parallel (QImage scaling and libpng release the GIL)
+        master = render_icon(MASTER_SIZE).toImage()
+        groups = group_by_size(iconset_entries(ICON_SIZES))
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            saved = list(executor.map(
+                lambda item: write_icon(master, item[0], iconset_dir / item[1][0]),
+                groups.items(),
+            ))
+
+        failed = [names[0] for names, ok in zip(groups.values(), saved) if not ok]
+        if failed:
+            print(f"Failed to write: {', '.join(failed)}", file=sys.stderr)
+            sys.exit(1)
 
-            # @2x (Retina) for sizes up to 512
-            if size <= 512:
-                retina_size = size * 2
-                filename_2x = f"icon_{size}x{size}@2x.png"
-                generate_icon_png(retina_size, str(iconset_dir / filename_2x))
+        # Same-size entries are byte-identical; link instead of re-encoding
+        for primary, *duplicates in groups.values():
+            for filename in duplicates:
+                link_or_copy(iconset_dir / primary, iconset_dir / filename)
 
         # Convert iconset to .icns using macOS iconutil
         icns_path = resources_dir / "TommyTalker.icns"
@@ -7,8 +7,8 @@ and app-aware text formatting on Apple Silicon.
 
 __version__ = "0.1.0"
 
-# Lazy imports - components are imported when accessed to avoid loading
-# heavy dependencies at package import time.
+# Lazy imports - components are imported when accessed (PEP 562) to avoid
+# loading heavy dependencies at package import time.
 #
 # Direct imports:
 #   from tommy_talker.engine import AudioCapture
@@ -16,31 +16,48 @@ __version__ = "0.1.0"
 #   from tommy_talker.gui import DashboardWindow
 #   from tommy_talker.app_controller import AppController
 
-__all__ = [
+import importlib
+
+_LAZY_IMPORTS = {
     # Engine
-    "AudioCapture",
-    "Recorder",
-    "SessionRecorder",
-    "Transcriber",
-    "OperatingMode",
-    "ModeManager",
-    "ModeResult",
+    "AudioCapture": "tommy_talker.engine.audio_capture",
+    "Recorder": "tommy_talker.engine.audio_capture",
+    "SessionRecorder": "tommy_talker.engine.audio_capture",
+    "Transcriber": "tommy_talker.engine.transcriber",
+    "OperatingMode": "tommy_talker.engine.modes",
+    "ModeManager": "tommy_talker.engine.modes",
+    "ModeResult": "tommy_talker.engine.modes",
     # Utils
-    "HardwareProfile",
-    "detect_hardware",
-    "UserConfig",
-    "load_config",
-    "save_config",
-    "ensure_data_dirs",
-    "PermissionStatus",
-    "check_permissions",
-    "HotkeyManager",
-    "type_at_cursor",
-    "paste_text",
+    "HardwareProfile": "tommy_talker.utils.hardware_detect",
+    "detect_hardware": "tommy_talker.utils.hardware_detect",
+    "UserConfig": "tommy_talker.utils.config",
+    "load_config": "tommy_talker.utils.config",
+    "save_config": "tommy_talker.utils.config",
+    "ensure_data_dirs": "tommy_talker.utils.config",
+    "PermissionStatus": "tommy_talker.utils.permissions",
+    "check_permissions": "tommy_talker.utils.permissions",
+    "HotkeyManager": "tommy_talker.utils.hotkeys",
+    "type_at_cursor": "tommy_talker.utils.typing",
+    "paste_text": "tommy_talker.utils.typing",
     # GUI
-    "MenuBarApp",
-    "DashboardWindow",
-    "SetupGuideWindow",
+    "MenuBarApp": "tommy_talker.gui.menu_bar",
+    "DashboardWindow": "tommy_talker.gui.dashboard",
+    "SetupGuideWindow": "tommy_talker.gui.setup_guide",
     # Controller
-    "AppController",
-]
+    "AppController": "tommy_talker.app_controller",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
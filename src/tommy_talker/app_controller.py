@@ -6,11 +6,13 @@ Main application orchestration connecting GUI, engine, and utils.
 import logging
 import re
 import time
+from contextlib import contextmanager
+from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
 
 log = logging.getLogger("TommyTalker")
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QThreadPool, QRunnable
 
 import sounddevice as sd
 
@@ -23,8 +25,57 @@ from tommy_talker.utils.typing import type_at_cursor, paste_text
 from tommy_talker.utils.audio_feedback import get_audio_feedback
 from tommy_talker.utils.app_context import AppContext, TextInputFormat, get_app_context
 
-# Minimum time between hotkey triggers (debounce)
-HOTKEY_DEBOUNCE_SECONDS = 0.5
+# Minimum time between hotkey triggers (debounce, monotonic nanoseconds)
+HOTKEY_DEBOUNCE_NS = 500_000_000
+
+# How long shutdown waits for a pending paste to finish
+IO_POOL_SHUTDOWN_TIMEOUT_MS = 1000
+
+# How long an enumerated input-device list stays valid (seconds)
+DEVICE_CACHE_TTL_S = 5.0
+
+# Device name that resolves to the host API's default input device
+DEFAULT_INPUT_DEVICE = "__default__"
+
+# Hotkey actions read from config, in registration order
+_HOTKEY_ACTIONS = ("cursor_mode", "toggle_record", "open_dashboard")
+
+# Idempotent state signals: a batch emits only the final value of each.
+# Every other signal is a one-shot event, emitted in order.
+_COALESCED_SIGNALS = frozenset({
+    "recording_changed", "session_recording_changed", "any_recording_changed",
+})
+
+# Signals that are also reported through the combined state_changed
+_STATE_SIGNALS = _COALESCED_SIGNALS | {"status_message"}
+
+# Spoken filler stripped from dictated terminal commands
+_FILLER_RE = re.compile(
+    r"\b(?:um|uh|so|like|please|can you|could you|go ahead and)\b", re.IGNORECASE
+)
+
+# Whitespace runs collapsed in search queries and terminal commands
+_WS_RE = re.compile(r"\s+")
+
+# Whitespace removed from dictated URLs
+_URL_TRANS = str.maketrans("", "", " \t\n\r")
+
+
+class _PasteTask(QRunnable):
+    """Paste text on the I/O pool and report success through a callback."""
+
+    def __init__(self, text: str, on_done):
+        super().__init__()
+        self._text = text
+        self._on_done = on_done
+
+    def run(self):
+        try:
+            success = paste_text(self._text)
+        except Exception as e:
+            log.error("Paste failed: %s", e)
+            success = False
+        self._on_done(success)
 
 
 class AppController(QObject):
@@ -46,14 +97,32 @@ class AppController(QObject):
     session_recording_changed = pyqtSignal(bool)  # True = session recording active
     any_recording_changed = pyqtSignal(bool)  # True = any recording active
     status_message = pyqtSignal(str)
+    state_changed = pyqtSignal(dict)  # {"ptt": bool, "session": bool[, "status": str]}
+
+    # Internal: paste result marshalled back from the I/O pool
+    _paste_done = pyqtSignal(bool)
 
     def __init__(self, config: UserConfig, hardware: HardwareProfile):
         super().__init__()
         self.config = config
         self.hardware = hardware
 
-        # Debounce tracking for hotkeys
-        self._last_hotkey_time: float = 0
+        # Snapshot of the last applied config; the dashboard edits the same
+        # object in place, so changes are detected against this copy
+        self._applied_config: dict = asdict(config)
+
+        # Debounce tracking for hotkeys (time.monotonic_ns)
+        self._last_hotkey_ns: int = 0
+
+        # Signal batching while _batch() is active: state signals coalesce
+        # by name, events queue in order
+        self._batch_depth: int = 0
+        self._pending_state: dict[str, tuple] = {}
+        self._pending_events: list[tuple[str, tuple]] = []
+
+        # Feedback sounds, warmed up front so the first hotkey press is instant
+        self._audio_fb = get_audio_feedback()
+        self._audio_fb.prewarm()
 
         # App context captured at recording start
         self._app_context: Optional[AppContext] = None
@@ -65,67 +134,158 @@ class AppController(QObject):
         # Session recorder (save to WAV)
         self._session_recorder: Optional[SessionRecorder] = None
 
-        # Initialize hotkey manager
+        # (monotonic timestamp, {input device name: index}) from sd.query_devices
+        self._device_cache: Optional[tuple[float, dict[str, int]]] = None
+
+        # Single-slot worker for clipboard/keystroke I/O so the hotkey
+        # thread is never blocked by paste_text
+        self._io_pool = QThreadPool()
+        self._io_pool.setMaxThreadCount(1)
+        self._paste_done.connect(self._on_paste_done)
+
+        # Initialize hotkey manager; action -> hotkey string currently registered
         self.hotkey_manager = HotkeyManager()
+        self._registered_hotkeys: dict[str, str] = {}
         self._register_hotkeys()
 
         # Set initial mode from config
-        self._current_mode = OperatingMode(config.default_mode)
+        self._current_mode = OperatingMode.from_value(config.default_mode)
 
     def _register_hotkeys(self):
         """Register global hotkeys from config."""
-        hotkeys = self.config.hotkeys
-        is_push_to_talk = self.config.recording_mode == "push_to_talk"
+        for action in _HOTKEY_ACTIONS:
+            if action in self.config.hotkeys:
+                self._register_hotkey(action, self.config.hotkeys[action])
 
-        # Cursor mode hotkey
-        if "cursor_mode" in hotkeys:
-            cursor_hotkey = hotkeys["cursor_mode"]
-            use_push_to_talk = is_push_to_talk or is_modifier_only_hotkey(cursor_hotkey)
+    def _register_hotkey(self, action: str, hotkey_str: str):
+        """Register the handler for one configured hotkey action."""
+        if action == "cursor_mode":
+            is_push_to_talk = self.config.recording_mode == "push_to_talk"
+            use_push_to_talk = is_push_to_talk or is_modifier_only_hotkey(hotkey_str)
 
             if use_push_to_talk:
                 self.hotkey_manager.register(
-                    cursor_hotkey,
+                    hotkey_str,
                     self._on_cursor_hotkey_down,
                     "Cursor Mode",
                     callback_up=self._on_hotkey_up
                 )
             else:
                 self.hotkey_manager.register(
-                    cursor_hotkey,
+                    hotkey_str,
                     self._on_cursor_hotkey_toggle,
-                    "Cursor Mode"
+                    "Cursor Mode",
+                    debounce_ns=HOTKEY_DEBOUNCE_NS
                 )
 
         # Toggle recording hotkey (always toggle behavior)
-        if "toggle_record" in hotkeys:
+        elif action == "toggle_record":
             self.hotkey_manager.register(
-                hotkeys["toggle_record"],
+                hotkey_str,
                 self.toggle_recording,
-                "Toggle Recording"
+                "Toggle Recording",
+                debounce_ns=HOTKEY_DEBOUNCE_NS
             )
 
         # Open dashboard hotkey (handled by GUI)
-        if "open_dashboard" in hotkeys:
+        elif action == "open_dashboard":
             self.hotkey_manager.register(
-                hotkeys["open_dashboard"],
-                lambda: self.status_message.emit("Opening dashboard..."),
+                hotkey_str,
+                self._on_dashboard_hotkey,
                 "Open Dashboard"
             )
 
+        self._registered_hotkeys[action] = hotkey_str
+
+    def _update_hotkeys(self, recording_mode_changed: bool):
+        """Re-register only the hotkey actions whose binding changed."""
+        dirty = [
+            action for action in _HOTKEY_ACTIONS
+            if self._registered_hotkeys.get(action) != self.config.hotkeys.get(action)
+            or (action == "cursor_mode" and recording_mode_changed)
+        ]
+        if not dirty:
+            return
+
+        # Unregister every stale binding first so swapped keys don't collide
+        for action in dirty:
+            old = self._registered_hotkeys.pop(action, None)
+            if old is not None:
+                self.hotkey_manager.unregister(old)
+
+        for action in dirty:
+            new = self.config.hotkeys.get(action)
+            if new is not None:
+                self._register_hotkey(action, new)
+
+        self.hotkey_manager.sync_taps()
+        log.debug("Re-registered hotkeys: %s", ", ".join(dirty))
+
+    def _on_dashboard_hotkey(self):
+        """Handle Open Dashboard hotkey (the GUI reacts to the status message)."""
+        self.status_message.emit("Opening dashboard...")
+
+    # ── Signal Batching ───────────────────────────────────────────
+
+    @contextmanager
+    def _batch(self):
+        """Queue signal emissions until the outermost batch exits (reentrant)."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_signals()
+
+    def _emit(self, signal_name: str, *args):
+        """Emit a signal (plus state_changed), or queue it while batching."""
+        if not self._batch_depth:
+            getattr(self, signal_name).emit(*args)
+            if signal_name in _STATE_SIGNALS:
+                self._emit_state(args[0] if signal_name == "status_message" else None)
+        elif signal_name in _COALESCED_SIGNALS:
+            self._pending_state[signal_name] = args
+        else:
+            self._pending_events.append((signal_name, args))
+
+    def _flush_signals(self):
+        """Emit final state signals, then queued events, then one state_changed."""
+        state_signals, self._pending_state = self._pending_state, {}
+        events, self._pending_events = self._pending_events, []
+
+        for signal_name, args in state_signals.items():
+            getattr(self, signal_name).emit(*args)
+        for signal_name, args in events:
+            getattr(self, signal_name).emit(*args)
+
+        statuses = [args[0] for signal_name, args in events if signal_name == "status_message"]
+        if state_signals or statuses:
+            self._emit_state(statuses[-1] if statuses else None)
+
+    def _emit_state(self, status: Optional[str] = None):
+        """Emit the combined recording state (and latest status, if any)."""
+        state = {"ptt": self.mode_manager.is_recording, "session": self.is_session_recording}
+        if status is not None:
+            state["status"] = status
+        self.state_changed.emit(state)
+
     # ── Push-to-Talk ──────────────────────────────────────────────
 
     def _on_cursor_hotkey_down(self):
         """Handle Cursor mode hotkey press (push-to-talk: start recording)."""
-        if self._current_mode != OperatingMode.CURSOR:
-            self.set_mode(OperatingMode.CURSOR)
-        if not self.mode_manager.is_recording:
-            self.start_recording()
+        with self._batch():
+            if self._current_mode != OperatingMode.CURSOR:
+                self.set_mode(OperatingMode.CURSOR)
+            if not self.mode_manager.is_recording:
+                self.start_recording()
 
     def _on_cursor_hotkey_toggle(self):
         """Handle Cursor mode hotkey press (toggle mode)."""
-        if self._current_mode != OperatingMode.CURSOR:
-            self.set_mode(OperatingMode.CURSOR)
-        self.toggle_recording()
+        with self._batch():
+            if self._current_mode != OperatingMode.CURSOR:
+                self.set_mode(OperatingMode.CURSOR)
+            self.toggle_recording()
 
     def _on_hotkey_up(self):
         """Handle hotkey release (push-to-talk: stop recording)."""
@@ -134,11 +294,12 @@ class AppController(QObject):
 
     def set_mode(self, mode: OperatingMode):
         """Set the current operating mode."""
-        if self.mode_manager.is_recording:
-            self.stop_recording()
+        with self._batch():
+            if self.mode_manager.is_recording:
+                self.stop_recording()
 
-        self._current_mode = mode
-        self.status_message.emit(f"Mode: {mode.value.title()}")
+            self._current_mode = mode
+            self._emit("status_message", f"Mode: {mode.value.title()}")
 
     def start_recording(self) -> bool:
         """Start push-to-talk recording."""
@@ -155,55 +316,60 @@ class AppController(QObject):
         success = self.mode_manager.start_mode(self._current_mode, app_context=self._app_context)
 
         if success:
-            get_audio_feedback().play_start()
+            self._audio_fb.play_start()
 
-            self.recording_started.emit()
-            self.recording_changed.emit(True)
-            self._update_any_recording()
+            with self._batch():
+                self._emit("recording_started")
+                self._emit("recording_changed", True)
+                self._update_any_recording()
 
-            ctx_hint = ""
-            if self._app_context and self._app_context.profile:
-                ctx_hint = f" [{self._app_context.app_name}]"
-            self.status_message.emit(f"Recording ({self._current_mode.value}){ctx_hint}...")
+                ctx_hint = ""
+                if self._app_context and self._app_context.profile:
+                    ctx_hint = f" [{self._app_context.app_name}]"
+                self._emit("status_message", f"Recording ({self._current_mode.value}){ctx_hint}...")
 
         return success
 
     def stop_recording(self) -> Optional[ModeResult]:
         """Stop push-to-talk recording and process result."""
-        result = self.mode_manager.stop_current_mode()
+        with self._batch():
+            result = self.mode_manager.stop_current_mode()
 
-        # Unmute mic in session recorder after PTT
-        if self._session_recorder and self._session_recorder.is_recording:
-            self._session_recorder.unmute_mic()
+            # Unmute mic in session recorder after PTT
+            if self._session_recorder and self._session_recorder.is_recording:
+                self._session_recorder.unmute_mic()
 
-        self.recording_changed.emit(False)
-        self._update_any_recording()
-
-        audio = get_audio_feedback()
-
-        if result:
-            self.recording_stopped.emit(result)
+            self._emit("recording_changed", False)
+            self._update_any_recording()
 
-            if result.success and result.text:
-                audio.play_stop()
-                self.status_message.emit("Recording processed")
-            elif result.success and not result.text:
-                audio.play_no_result()
-                self.status_message.emit("No speech detected")
+            audio = self._audio_fb
+
+            if result:
+                self._emit("recording_stopped", result)
+
+                if result.success and result.text:
+                    audio.play_stop()
+                    if result.metadata and result.metadata.get("truncated"):
+                        self._emit("status_message", "Recording limit reached; later audio was not transcribed")
+                    else:
+                        self._emit("status_message", "Recording processed")
+                elif result.success and not result.text:
+                    audio.play_no_result()
+                    self._emit("status_message", "No speech detected")
+                else:
+                    audio.play_error()
+                    self._emit("status_message", f"Error: {result.error}")
             else:
-                audio.play_error()
-                self.status_message.emit(f"Error: {result.error}")
-        else:
-            audio.play_stop()
+                audio.play_stop()
 
         return result
 
     def toggle_recording(self):
         """Toggle push-to-talk recording state with debounce."""
-        now = time.time()
-        if now - self._last_hotkey_time < HOTKEY_DEBOUNCE_SECONDS:
+        now = time.monotonic_ns()
+        if now - self._last_hotkey_ns < HOTKEY_DEBOUNCE_NS:
             return
-        self._last_hotkey_time = now
+        self._last_hotkey_ns = now
 
         if self.mode_manager.is_recording:
             self.stop_recording()
@@ -212,18 +378,37 @@ class AppController(QObject):
 
     # ── Session Recording ─────────────────────────────────────────
 
+    def _input_devices(self) -> dict[str, int]:
+        """Map input device names to indices, re-enumerating after the TTL."""
+        now = time.monotonic()
+        if self._device_cache and now - self._device_cache[0] < DEVICE_CACHE_TTL_S:
+            return self._device_cache[1]
+
+        devices: dict[str, int] = {}
+        try:
+            for i, dev in enumerate(sd.query_devices()):
+                if dev["max_input_channels"] > 0:
+                    devices.setdefault(dev["name"], i)
+
+            default_input = sd.default.device[0]
+            if default_input is not None and default_input >= 0:
+                devices[DEFAULT_INPUT_DEVICE] = default_input
+        except Exception as e:
+            log.debug("Device enumeration failed: %s", e)
+            return devices
+
+        self._device_cache = (now, devices)
+        return devices
+
+    def invalidate_device_cache(self):
+        """Force the next device lookup to re-enumerate audio devices."""
+        self._device_cache = None
+
     def _resolve_device_index(self, device_name: Optional[str]) -> Optional[int]:
         """Resolve a device name to a sounddevice device index."""
         if not device_name:
             return None
-        try:
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
-                if dev["name"] == device_name and dev["max_input_channels"] > 0:
-                    return i
-        except Exception:
-            pass
-        return None
+        return self._input_devices().get(device_name)
 
     def start_session_recording(self) -> bool:
         """Start a session recording (save audio to WAV file)."""
@@ -235,25 +420,27 @@ class AppController(QObject):
         self._session_recorder = SessionRecorder(
             source_mode=self.config.session_audio_source,
             system_device=system_device,
+            subtype=self.config.session_audio_subtype,
         )
 
         try:
             path = self._session_recorder.start()
             if path is None:
                 self._session_recorder = None
-                self.status_message.emit("Session recording failed to start")
+                self._emit("status_message", "Session recording failed to start")
                 return False
 
-            get_audio_feedback().play_start()
-            self.session_recording_changed.emit(True)
-            self._update_any_recording()
-            self.status_message.emit("Session recording started")
+            self._audio_fb.play_start()
+            with self._batch():
+                self._emit("session_recording_changed", True)
+                self._update_any_recording()
+                self._emit("status_message", "Session recording started")
             return True
 
         except Exception as e:
             log.error("Session recording error: %s", e)
             self._session_recorder = None
-            self.status_message.emit(f"Session recording failed: {e}")
+            self._emit("status_message", f"Session recording failed: {e}")
             return False
 
     def stop_session_recording(self) -> Optional[Path]:
@@ -264,14 +451,15 @@ class AppController(QObject):
         path = self._session_recorder.stop()
         self._session_recorder = None
 
-        get_audio_feedback().play_stop()
-        self.session_recording_changed.emit(False)
-        self._update_any_recording()
+        self._audio_fb.play_stop()
+        with self._batch():
+            self._emit("session_recording_changed", False)
+            self._update_any_recording()
 
-        if path:
-            self.status_message.emit(f"Session saved: {path.name}")
-        else:
-            self.status_message.emit("Session recording stopped")
+            if path:
+                self._emit("status_message", f"Session saved: {path.name}")
+            else:
+                self._emit("status_message", "Session recording stopped")
 
         return path
 
@@ -292,7 +480,7 @@ class AppController(QObject):
         """Emit unified any-recording-active signal."""
         ptt_active = self.mode_manager.is_recording
         session_active = self.is_session_recording
-        self.any_recording_changed.emit(ptt_active or session_active)
+        self._emit("any_recording_changed", ptt_active or session_active)
 
     def _apply_output_formatting(self, text: str) -> str:
         """Apply lightweight output formatting based on app context."""
@@ -303,13 +491,12 @@ class AppController(QObject):
 
         if fmt == TextInputFormat.SEARCH_QUERY:
             text = text.strip().rstrip(".,!?;:")
-            text = " ".join(text.split())
+            text = _WS_RE.sub(" ", text).strip()
         elif fmt == TextInputFormat.TERMINAL_COMMAND:
-            filler = r"\b(um|uh|so|like|please|can you|could you|go ahead and)\b"
-            text = re.sub(filler, "", text, flags=re.IGNORECASE)
-            text = " ".join(text.split()).strip().strip(".,!?;:").strip()
+            text = _FILLER_RE.sub("", text)
+            text = _WS_RE.sub(" ", text).strip().strip(".,!?;:").strip()
         elif fmt == TextInputFormat.URL:
-            text = text.replace(" ", "")
+            text = text.translate(_URL_TRANS)
 
         return text
 
@@ -335,25 +522,38 @@ class AppController(QObject):
 
         text = self._apply_output_formatting(text)
         text = self._apply_word_replacements(text)
-        success = paste_text(text)
+        self._io_pool.start(_PasteTask(text, self._paste_done.emit))
 
+    def _on_paste_done(self, success: bool):
+        """Report paste outcome (runs on the controller's thread)."""
         if success:
-            self.status_message.emit("Text pasted")
+            self._emit("status_message", "Text pasted")
         else:
-            self.status_message.emit("Failed to paste text")
+            self._emit("status_message", "Failed to paste text")
 
     def update_config(self, new_config: UserConfig):
-        """Update configuration and save."""
+        """Update configuration and save (skipped when nothing changed)."""
+        snapshot = asdict(new_config)
+        previous = self._applied_config
         self.config = new_config
-        self.mode_manager.config = new_config
 
-        # Re-register hotkeys if changed
-        self.hotkey_manager.stop()
-        self._register_hotkeys()
-        self.hotkey_manager.start()
+        # Saving settings is the natural point to pick up newly attached devices
+        self.invalidate_device_cache()
+
+        if snapshot == previous:
+            log.debug("Config unchanged, skipping update")
+            return
+        self._applied_config = snapshot
+
+        self.mode_manager.update_config(new_config)
+
+        # Re-register only hotkeys whose binding (or trigger mode) changed
+        recording_mode_changed = snapshot["recording_mode"] != previous["recording_mode"]
+        if recording_mode_changed or snapshot["hotkeys"] != previous["hotkeys"]:
+            self._update_hotkeys(recording_mode_changed)
 
         save_config(new_config)
-        self.status_message.emit("Settings saved")
+        self._emit("status_message", "Settings saved")
 
     def start_hotkeys(self) -> bool:
         """Start listening for global hotkeys."""
@@ -371,7 +571,9 @@ class AppController(QObject):
 
         if self.mode_manager.is_recording:
             self.mode_manager.stop_current_mode()
+        self.mode_manager.shutdown()
 
+        self._io_pool.waitForDone(IO_POOL_SHUTDOWN_TIMEOUT_MS)
         self.hotkey_manager.stop()
         log.info("AppController shutdown complete")
 
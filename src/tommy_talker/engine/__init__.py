@@ -1,24 +1,49 @@
 """
 TommyTalker Engine Module
 Audio capture, transcription, and mode orchestration.
+
+Audio capture is imported eagerly; the transcriber and mode controllers
+(which pull in mlx_whisper) are imported lazily on first access (PEP 562).
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from tommy_talker.engine.audio_capture import AudioCapture, Recorder, SessionRecorder
-from tommy_talker.engine.transcriber import Transcriber
-from tommy_talker.engine.modes import (
-    OperatingMode,
-    ModeManager,
-    ModeResult,
-    CursorModeController,
-)
+
+if TYPE_CHECKING:
+    from tommy_talker.engine.transcriber import Transcriber
+    from tommy_talker.engine.modes import (
+        OperatingMode,
+        ModeManager,
+        ModeResult,
+        CursorModeController,
+    )
+
+_LAZY_IMPORTS = {
+    "Transcriber": "tommy_talker.engine.transcriber",
+    "OperatingMode": "tommy_talker.engine.modes",
+    "ModeManager": "tommy_talker.engine.modes",
+    "ModeResult": "tommy_talker.engine.modes",
+    "CursorModeController": "tommy_talker.engine.modes",
+}
 
 __all__ = [
     "AudioCapture",
     "Recorder",
     "SessionRecorder",
-    "Transcriber",
-    "OperatingMode",
-    "ModeManager",
-    "ModeResult",
-    "CursorModeController",
+    *_LAZY_IMPORTS,
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
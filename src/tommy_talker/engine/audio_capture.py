@@ -5,7 +5,6 @@ Audio recording for push-to-talk transcription and session recording.
 
 import logging
 import threading
-from collections import deque
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
@@ -27,24 +26,209 @@ except ImportError:
 RECORDINGS_DIR = Path.home() / "Documents" / "TommyTalker" / "Recordings"
 
 
-@dataclass
+class RingBuffer:
+    """
+    Fixed-capacity float32 sample ring for one producer and one consumer.
+
+    The audio thread copies samples straight into preallocated storage and
+    then publishes ``write_idx`` (a running count of samples written); the
+    consumer owns ``read_idx``. Each index has a single writer, so no lock
+    is needed — under the GIL the sample copy is visible before the index
+    store that follows it.
+
+    With ``max_capacity`` set the ring never overwrites unconsumed samples.
+    Once it is half full the producer sets ``grow_requested``; another
+    thread then calls prepare_growth() to allocate a doubled buffer and
+    copy the unconsumed samples into it, and the producer's next write
+    only copies the blocks written since and swaps the buffer in. Samples
+    that find no room (``max_capacity`` reached, or growth not ready in
+    time) are discarded, as is everything after them, and counted in
+    ``dropped``.
+    """
+
+    # Fill fraction at which a bounded ring asks to grow
+    GROW_AT = 0.5
+
+    __slots__ = (
+        "max_capacity", "dropped", "grow_requested", "_buf", "_spare", "_write_idx", "read_idx",
+    )
+
+    def __init__(self, capacity: int, max_capacity: Optional[int] = None):
+        self.max_capacity = max_capacity
+        self.dropped = 0  # samples discarded when full (producer side)
+        self.grow_requested = threading.Event() if max_capacity is not None else None
+        self._buf = np.empty(capacity, dtype=np.float32)
+        self._spare = None  # (buffer, samples copied) from prepare_growth
+        self._write_idx = 0  # advanced only by the producer
+        self.read_idx = 0  # advanced only by the consumer
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    @property
+    def write_idx(self) -> int:
+        return self._write_idx
+
+    @property
+    def available(self) -> int:
+        """Samples written but not yet consumed."""
+        return self._write_idx - self.read_idx
+
+    @property
+    def overrun(self) -> int:
+        """Unconsumed samples already overwritten by the producer."""
+        return max(self.available - self.capacity, 0)
+
+    @staticmethod
+    def _spans(start: int, n: int, capacity: int) -> list[tuple[int, int]]:
+        """Storage index ranges holding n samples from logical index start."""
+        pos = start % capacity
+        first = min(n, capacity - pos)
+        if first == n:
+            return [(pos, pos + n)]
+        return [(pos, pos + first), (0, n - first)]
+
+    @classmethod
+    def _put(cls, buf: np.ndarray, start: int, samples: np.ndarray):
+        """Copy samples into buf at logical index start."""
+        offset = 0
+        for begin, end in cls._spans(start, len(samples), len(buf)):
+            np.copyto(buf[begin:end], samples[offset:offset + end - begin])
+            offset += end - begin
+
+    @classmethod
+    def _copy_range(cls, src: np.ndarray, dst: np.ndarray, start: int, stop: int):
+        """Copy logical indices [start, stop) between buffers of any size."""
+        for begin, end in cls._spans(start, stop - start, len(src)):
+            cls._put(dst, start, src[begin:end])
+            start += end - begin
+
+    def prepare_growth(self):
+        """Allocate the next buffer and copy unconsumed samples into it.
+
+        Runs off the audio thread; the producer swaps the result in on its
+        next write. Only one thread may call this.
+        """
+        buf = self._buf
+        if self._spare is not None or len(buf) >= self.max_capacity:
+            return
+        stop = self._write_idx
+        grown = np.empty(min(len(buf) * 2, self.max_capacity), dtype=np.float32)
+        self._copy_range(buf, grown, self.read_idx, stop)
+        self._spare = (grown, stop)
+
+    def cancel_growth(self):
+        """Drop a prepared buffer; only call while the producer is stopped."""
+        self._spare = None
+        if self.grow_requested is not None:
+            self.grow_requested.clear()
+
+    def _adopt_spare(self):
+        """Swap in the buffer from prepare_growth (producer side)."""
+        grown, copied = self._spare
+        self._copy_range(self._buf, grown, copied, self._write_idx)
+        self._buf = grown
+        self._spare = None
+
+    def write(self, samples: np.ndarray):
+        """Append samples, overwriting the oldest data once full (unless bounded)."""
+        if self.max_capacity is not None:
+            if self._spare is not None:
+                self._adopt_spare()
+            room = self.capacity - self.available
+            if self.dropped or len(samples) > room:
+                kept = 0 if self.dropped else room
+                self.dropped += len(samples) - kept
+                samples = samples[:kept]
+
+        n = len(samples)
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+        self._put(self._buf, self._write_idx + n - len(samples), samples)
+        self._write_idx += n
+
+        if (
+            self.grow_requested is not None
+            and self._spare is None
+            and self.capacity < self.max_capacity
+            and self.available > self.capacity * self.GROW_AT
+            and not self.grow_requested.is_set()
+        ):
+            self.grow_requested.set()
+
+    def write_zeros(self, n: int):
+        """Append n samples of silence."""
+        kept = min(n, self.capacity)
+        for begin, end in self._spans(self._write_idx + n - kept, kept, self.capacity):
+            self._buf[begin:end] = 0.0
+
+        self._write_idx += n
+
+    def views(self, start: int, stop: Optional[int] = None) -> list[np.ndarray]:
+        """Views of the samples between two ``write_idx`` values (no copy)."""
+        if stop is None:
+            stop = self._write_idx
+        # Read after write_idx: a buffer swapped in by growth already holds
+        # every sample up to stop, and the old one is never written again
+        buf = self._buf
+        capacity = len(buf)
+        if stop - start > capacity:
+            log.warning("RingBuffer overrun: dropped %d samples", stop - start - capacity)
+            start = stop - capacity
+
+        n = max(stop - start, 0)
+        return [buf[begin:end] for begin, end in self._spans(start, n, capacity)]
+
+    def read(self, start: int, stop: Optional[int] = None) -> np.ndarray:
+        """Copy out samples written between two ``write_idx`` values."""
+        views = self.views(start, stop)
+        out = np.empty(sum(len(v) for v in views), dtype=np.float32)
+        self._copy_views(views, out)
+        return out
+
+    def read_into(self, start: int, out: np.ndarray):
+        """Copy ``len(out)`` samples beginning at ``start`` into out."""
+        self._copy_views(self.views(start, start + len(out)), out)
+
+    @staticmethod
+    def _copy_views(views: list[np.ndarray], out: np.ndarray):
+        offset = 0
+        for view in views:
+            np.copyto(out[offset:offset + len(view)], view)
+            offset += len(view)
+
+
+@dataclass(slots=True)
 class AudioChunk:
-    """A chunk of audio data with timestamp."""
+    """A chunk of audio data with its capture time.
+
+    ``timestamp`` is PortAudio's ADC time for the block (seconds on the
+    stream clock), or None when the host API does not report one.
+    """
     data: np.ndarray
     sample_rate: int
-    timestamp: datetime
+    timestamp: Optional[float] = None
 
 
 class AudioCapture:
     """
     Low-level audio capture using sounddevice.
-    Provides raw audio chunks via callback.
+
+    Samples from the first channel are copied into ``ring`` when one is
+    given; ``callback`` additionally receives each block as an AudioChunk
+    (live preview).
     """
 
     DEFAULT_SAMPLE_RATE = 16000  # Whisper expects 16kHz
     DEFAULT_CHANNELS = 1
     DEFAULT_CHUNK_SIZE = 1024
 
+    __slots__ = (
+        "sample_rate", "channels", "chunk_size", "callback", "device", "ring",
+        "_stream", "_is_recording",
+    )
+
     def __init__(
         self,
         sample_rate: int = DEFAULT_SAMPLE_RATE,
@@ -52,12 +236,14 @@ class AudioCapture:
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         callback: Optional[Callable[[AudioChunk], None]] = None,
         device: Optional[int] = None,
+        ring: Optional[RingBuffer] = None,
     ):
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
         self.callback = callback
         self.device = device
+        self.ring = ring
 
         self._stream: Optional[sd.InputStream] = None
         self._is_recording = False
@@ -67,11 +253,17 @@ class AudioCapture:
         if status:
             log.debug("AudioCapture status: %s", status)
 
-        if self.callback and self._is_recording:
+        if not self._is_recording:
+            return
+
+        if self.ring is not None:
+            self.ring.write(indata[:, 0])
+
+        if self.callback:
             chunk = AudioChunk(
                 data=indata.copy(),
                 sample_rate=self.sample_rate,
-                timestamp=datetime.now()
+                timestamp=time_info.inputBufferAdcTime if time_info else None,
             )
             self.callback(chunk)
 
@@ -84,6 +276,7 @@ class AudioCapture:
             samplerate=self.sample_rate,
             channels=self.channels,
             blocksize=self.chunk_size,
+            dtype="float32",
             callback=self._audio_callback,
             device=self.device,
         )
@@ -112,11 +305,21 @@ class Recorder:
     """
     In-memory audio recorder for push-to-talk.
 
-    Captures audio into a memory buffer via AudioCapture. On stop,
-    returns the buffered audio as a numpy array ready for transcription.
-    No files are written to disk.
+    Captures audio into a ring buffer via AudioCapture. On stop, returns
+    the buffered audio as a numpy array ready for transcription. No files
+    are written to disk.
+
+    A helper thread grows the ring for long dictation, so the audio
+    callback never allocates.
     """
 
+    # Ring size at the start of each recording; grows for longer dictation
+    INITIAL_RECORDING_SECONDS = 30
+    # Longest utterance kept in memory; audio past this point is discarded
+    MAX_RECORDING_SECONDS = 600
+
+    __slots__ = ("live_callback", "sample_rate", "truncated", "_capture", "_ring", "_grower")
+
     def __init__(
         self,
         live_callback: Optional[Callable[[AudioChunk], None]] = None,
@@ -125,29 +328,47 @@ class Recorder:
         self.live_callback = live_callback
         self.sample_rate = sample_rate
 
-        self._capture: Optional[AudioCapture] = None
-        self._buffer: list[np.ndarray] = []
-        self._buffer_lock = threading.Lock()
+        # True when the last recording hit MAX_RECORDING_SECONDS
+        self.truncated = False
 
-    def _on_audio_chunk(self, chunk: AudioChunk):
-        """Handle incoming audio — forward to live callback and buffer."""
-        if self.live_callback:
-            self.live_callback(chunk)
+        self._capture: Optional[AudioCapture] = None
+        self._ring = self._new_ring()
+        self._grower: Optional[threading.Thread] = None
 
-        with self._buffer_lock:
-            self._buffer.append(chunk.data)
+    def _new_ring(self) -> RingBuffer:
+        return RingBuffer(
+            self.INITIAL_RECORDING_SECONDS * self.sample_rate,
+            max_capacity=self.MAX_RECORDING_SECONDS * self.sample_rate,
+        )
 
     def start(self):
         """Start recording into memory buffer."""
-        with self._buffer_lock:
-            self._buffer = []
+        # Discard anything left over from a previous recording
+        self._ring.read_idx = self._ring.write_idx
+        self._ring.dropped = 0
+        self.truncated = False
 
         self._capture = AudioCapture(
             sample_rate=self.sample_rate,
-            callback=self._on_audio_chunk
+            callback=self.live_callback,
+            ring=self._ring,
         )
         self._capture.start()
 
+        self._grower = threading.Thread(
+            target=self._grow_loop, args=(self._ring,), name="RecorderGrow", daemon=True
+        )
+        self._grower.start()
+
+    def _grow_loop(self, ring: RingBuffer):
+        """Prepare the ring's next buffer whenever the audio thread asks."""
+        while True:
+            ring.grow_requested.wait()
+            ring.grow_requested.clear()
+            if self._capture is None:
+                return
+            ring.prepare_growth()
+
     def stop(self) -> Optional[np.ndarray]:
         """
         Stop recording and return buffered audio.
@@ -162,12 +383,29 @@ class Recorder:
         self._capture.stop()
         self._capture = None
 
-        with self._buffer_lock:
-            if not self._buffer:
-                return None
-            audio = np.concatenate(self._buffer, axis=0).flatten().astype(np.float32)
-            self._buffer = []
+        ring = self._ring
+        if self._grower:
+            ring.grow_requested.set()
+            self._grower.join()
+            self._grower = None
+        ring.cancel_growth()
+
+        if ring.dropped:
+            self.truncated = True
+            log.warning(
+                "Recording buffer full (limit %ds): discarded last %.1fs of audio",
+                self.MAX_RECORDING_SECONDS, ring.dropped / self.sample_rate,
+            )
 
+        # Release a ring grown by long dictation
+        if ring.capacity > self.INITIAL_RECORDING_SECONDS * self.sample_rate:
+            self._ring = self._new_ring()
+
+        if not ring.available:
+            return None
+        stop = ring.write_idx
+        audio = ring.read(ring.read_idx, stop)
+        ring.read_idx = stop
         return audio
 
     @property
@@ -184,13 +422,38 @@ class SessionRecorder:
     - "system": Record from a virtual audio device (e.g., BlackHole)
     - "system_and_mic": Mix both sources into a single mono WAV
 
+    Audio callbacks only append to per-source ring buffers (system audio
+    is copied straight from PortAudio's buffer); a writer thread mixes
+    and writes to the file.
+
     Provides mute_mic()/unmute_mic() so push-to-talk usage is excluded
     from session recordings.
     """
 
     DEFAULT_SAMPLE_RATE = 44100  # CD quality for archival
     DEFAULT_CHANNELS = 1
-    DEFAULT_CHUNK_SIZE = 2048
+    # 0 lets the host API pick its native period: fewer callbacks (and GIL
+    # hand-offs between the mic and system streams) at the cost of ~10-20ms
+    # extra latency, which does not matter for archival. Push-to-talk keeps
+    # AudioCapture's fixed 1024 for responsiveness.
+    DEFAULT_CHUNK_SIZE = 0
+    # 16-bit PCM is plenty for voice; libsndfile quantizes the float input
+    DEFAULT_SUBTYPE = "PCM_16"
+
+    # Audio buffered per source while the writer catches up
+    RING_SECONDS = 10
+    # Frames staged before each file write (~1.5s at 44.1kHz, 256KB float32);
+    # the ring holds them until then, so libsndfile is entered far less often
+    WRITE_FRAMES = 65536
+    # Writer wake-up interval when no callback has signalled
+    WRITER_POLL_S = 0.5
+
+    __slots__ = (
+        "source_mode", "mic_device", "system_device", "sample_rate", "output_dir",
+        "subtype", "_mic_capture", "_system_capture", "_sf_file", "_file_path",
+        "_mic_muted", "_mic_ring", "_system_ring", "_writer_thread", "_data_ready",
+        "_stopping", "_mix_out", "_mix_scratch",
+    )
 
     def __init__(
         self,
@@ -199,63 +462,94 @@ class SessionRecorder:
         system_device: Optional[int] = None,
         sample_rate: int = DEFAULT_SAMPLE_RATE,
         output_dir: Path = RECORDINGS_DIR,
+        subtype: str = DEFAULT_SUBTYPE,
     ):
         self.source_mode = source_mode
         self.mic_device = mic_device
         self.system_device = system_device
         self.sample_rate = sample_rate
         self.output_dir = output_dir
+        self.subtype = subtype
 
         self._mic_capture: Optional[AudioCapture] = None
         self._system_capture: Optional[AudioCapture] = None
         self._sf_file: Optional["sf.SoundFile"] = None
         self._file_path: Optional[Path] = None
-        self._write_lock = threading.Lock()
         self._mic_muted = False
 
-        # Deques for dual-source mixing
-        self._mic_deque: deque = deque()
-        self._system_deque: deque = deque()
+        # Per-source rings: audio callbacks produce, the writer consumes
+        self._mic_ring: Optional[RingBuffer] = None
+        self._system_ring: Optional[RingBuffer] = None
+
+        # Writer thread state; scratch buffers are allocated once in start()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._data_ready = threading.Event()
+        self._stopping = False
+        self._mix_out: Optional[np.ndarray] = None
+        self._mix_scratch: Optional[np.ndarray] = None
 
     def _on_mic_chunk(self, chunk: AudioChunk):
-        """Handle incoming mic audio."""
-        if self.source_mode == "system_and_mic":
-            with self._write_lock:
-                if self._mic_muted:
-                    self._mic_deque.append(np.zeros_like(chunk.data))
-                else:
-                    self._mic_deque.append(chunk.data)
-                self._flush_mixed()
+        """Handle incoming mic audio (audio thread)."""
+        if self._mic_muted:
+            # Keep the mix aligned with system audio; mic-only drops it
+            if self.source_mode == "system_and_mic":
+                self._mic_ring.write_zeros(len(chunk.data))
         else:
-            # Direct write for mic-only mode
-            with self._write_lock:
-                if self._sf_file and not self._mic_muted:
-                    self._sf_file.write(chunk.data)
-
-    def _on_system_chunk(self, chunk: AudioChunk):
-        """Handle incoming system audio."""
+            self._mic_ring.write(chunk.data[:, 0])
+        if self._mic_ring.available >= self.WRITE_FRAMES:
+            self._data_ready.set()
+
+    def _writer_loop(self):
+        """Drain the rings into the file until stop() is requested."""
+        while not self._stopping:
+            self._data_ready.wait(self.WRITER_POLL_S)
+            self._data_ready.clear()
+            self._write_available()
+        self._write_available(flush=True)
+
+    def _write_available(self, flush: bool = False):
+        """Write buffered samples once a full batch is staged, or all on flush."""
         if self.source_mode == "system_and_mic":
-            with self._write_lock:
-                self._system_deque.append(chunk.data)
-                self._flush_mixed()
-        else:
-            # Direct write for system-only mode
-            with self._write_lock:
-                if self._sf_file:
-                    self._sf_file.write(chunk.data)
+            self._write_mixed(flush)
+            return
 
-    def _flush_mixed(self):
-        """Mix matching mic and system chunks and write to file."""
-        while self._mic_deque and self._system_deque:
-            mic_data = self._mic_deque.popleft()
-            sys_data = self._system_deque.popleft()
+        ring = self._mic_ring if self.source_mode == "mic" else self._system_ring
+        if ring.available < self.WRITE_FRAMES and not flush:
+            return
+        stop = ring.write_idx
+        for view in ring.views(ring.read_idx, stop):
+            self._sf_file.write(view)
+        ring.read_idx = stop
+
+    def _write_mixed(self, flush: bool):
+        """Average aligned mic and system samples in place and write them."""
+        mic, system = self._mic_ring, self._system_ring
+
+        # If either ring lapped the writer, skip both forward by the same
+        # amount so the sources stay time-aligned
+        dropped = max(mic.overrun, system.overrun)
+        if dropped:
+            log.warning("SessionRecorder writer fell behind: dropped %d frames", dropped)
+            mic.read_idx += dropped
+            system.read_idx += dropped
+
+        available = min(mic.available, system.available)
+        if available < self.WRITE_FRAMES and not flush:
+            return
+        while available > 0:
+            n = min(available, self.WRITE_FRAMES)
+            mix = self._mix_out[:n]
+            scratch = self._mix_scratch[:n]
 
-            # Match lengths (in case of slight chunk size differences)
-            min_len = min(len(mic_data), len(sys_data))
-            mixed = (mic_data[:min_len] + sys_data[:min_len]) * 0.5
+            mic.read_into(mic.read_idx, mix)
+            system.read_into(system.read_idx, scratch)
+            np.add(mix, scratch, out=mix)
+            mix *= 0.5
+            self._sf_file.write(mix)
 
-            if self._sf_file:
-                self._sf_file.write(mixed)
+            mic.read_idx += n
+            system.read_idx += n
+            available -= n
 
     def start(self) -> Optional[Path]:
         """Start session recording. Creates WAV file and begins capture."""
@@ -274,9 +568,15 @@ class SessionRecorder:
             samplerate=self.sample_rate,
             channels=self.DEFAULT_CHANNELS,
             format="WAV",
-            subtype="FLOAT",
+            subtype=self.subtype,
         )
 
+        ring_size = self.RING_SECONDS * self.sample_rate
+        self._mic_ring = RingBuffer(ring_size)
+        self._system_ring = RingBuffer(ring_size)
+        self._mix_out = np.empty(self.WRITE_FRAMES, dtype=np.float32)
+        self._mix_scratch = np.empty(self.WRITE_FRAMES, dtype=np.float32)
+
         # Start capture(s) based on source mode
         if self.source_mode in ("mic", "system_and_mic"):
             self._mic_capture = AudioCapture(
@@ -298,11 +598,18 @@ class SessionRecorder:
                 sample_rate=self.sample_rate,
                 channels=self.DEFAULT_CHANNELS,
                 chunk_size=self.DEFAULT_CHUNK_SIZE,
-                callback=self._on_system_chunk,
                 device=self.system_device,
+                ring=self._system_ring,
             )
             self._system_capture.start()
 
+        self._stopping = False
+        self._data_ready.clear()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="SessionWriter", daemon=True
+        )
+        self._writer_thread.start()
+
         log.info("SessionRecorder recording (%s) to: %s", self.source_mode, self._file_path)
         return self._file_path
 
@@ -319,18 +626,19 @@ class SessionRecorder:
             self._system_capture.stop()
             self._system_capture = None
 
-        # Flush any remaining mixed chunks
-        with self._write_lock:
-            if self.source_mode == "system_and_mic":
-                self._flush_mixed()
-            if self._sf_file:
-                self._sf_file.close()
-                self._sf_file = None
+        # Let the writer drain what the callbacks buffered, then finalize
+        if self._writer_thread:
+            self._stopping = True
+            self._data_ready.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+
+        if self._sf_file:
+            self._sf_file.close()
+            self._sf_file = None
 
         path = self._file_path
         self._file_path = None
-        self._mic_deque.clear()
-        self._system_deque.clear()
 
         log.info("SessionRecorder saved: %s", path)
         return path
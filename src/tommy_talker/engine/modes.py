@@ -4,6 +4,7 @@ Push-to-talk cursor mode orchestration.
 """
 
 import logging
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Callable
@@ -20,8 +21,19 @@ class OperatingMode(Enum):
     """Operating mode."""
     CURSOR = "cursor"
 
+    @classmethod
+    def from_value(cls, value: str) -> "OperatingMode":
+        """Look up a mode by its config string."""
+        try:
+            return _OPERATING_MODE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_OPERATING_MODE_BY_VALUE: dict[str, OperatingMode] = {m.value: m for m in OperatingMode}
+
 
-@dataclass
+@dataclass(slots=True)
 class ModeResult:
     """Result from a mode operation."""
     success: bool
@@ -36,7 +48,13 @@ class CursorModeController:
     Record -> Transcribe in memory -> Type at cursor
     """
 
+    __slots__ = (
+        "config", "hardware", "on_text_ready", "_is_active",
+        "_app_context", "transcriber", "recorder",
+    )
+
     def __init__(self, config: UserConfig, hardware: HardwareProfile,
+                 transcriber: Transcriber,
                  on_text_ready: Optional[Callable[[str], None]] = None):
         self.config = config
         self.hardware = hardware
@@ -44,10 +62,8 @@ class CursorModeController:
         self._is_active = False
         self._app_context = None
 
-        self.transcriber = Transcriber(
-            tier=hardware.tier,
-            custom_vocabulary=config.vocabulary
-        )
+        # Shared across controllers; owned by ModeManager
+        self.transcriber = transcriber
         self.recorder = Recorder()
 
     def set_app_context(self, app_context):
@@ -63,13 +79,19 @@ class CursorModeController:
     def stop(self) -> ModeResult:
         """Stop recording and transcribe from memory."""
         self._is_active = False
+        # Bind once: the manager may swap or dispose the shared transcriber
+        # while this (off-lock) stop is transcribing
+        transcriber = self.transcriber
 
         audio_data = self.recorder.stop()
 
         if audio_data is None or len(audio_data) == 0:
             return ModeResult(success=False, text="", error="No audio recorded")
 
-        result = self.transcriber.transcribe_audio(audio_data)
+        if transcriber is None:
+            return ModeResult(success=False, text="", error="Transcriber unavailable")
+
+        result = transcriber.transcribe_audio(audio_data)
 
         if not result:
             return ModeResult(success=False, text="", error="Transcription failed")
@@ -81,9 +103,17 @@ class CursorModeController:
         return ModeResult(
             success=True,
             text=result.text,
-            metadata={"duration": result.duration}
+            metadata={"duration": result.duration, "truncated": self.recorder.truncated}
         )
 
+    def dispose(self):
+        """Stop any in-flight recording and drop the shared transcriber reference."""
+        if self.recorder.is_recording:
+            self.recorder.stop()
+        self._is_active = False
+        self._app_context = None
+        self.transcriber = None
+
     @property
     def is_active(self) -> bool:
         return self._is_active
@@ -93,6 +123,11 @@ class ModeManager:
     """
     Central manager for operating modes.
     Ensures only one mode is active at a time.
+
+    Controllers are created on first use and cached per mode, so repeated
+    start/stop cycles reuse the same recorder. A single Transcriber is
+    shared by every controller. Config updates are applied to cached
+    controllers in place, so saving settings never interrupts a recording.
     """
 
     def __init__(self, config: UserConfig, hardware: HardwareProfile):
@@ -101,19 +136,100 @@ class ModeManager:
 
         self._current_mode: Optional[OperatingMode] = None
         self._current_controller: Optional[CursorModeController] = None
+        self._controllers: dict[OperatingMode, CursorModeController] = {}
+        self._transcriber_settings = self._get_transcriber_settings(config)
+        self.transcriber = self._create_transcriber()
+
+        # Recordings started but not yet fully stopped (stop() transcribes
+        # off-lock); a transcriber rebuild waits until this drops to zero
+        self._in_flight = 0
+        self._transcriber_rebuild_pending = False
+
+        # Hotkey callbacks may arrive off the Qt thread
+        self._lock = threading.Lock()
+
+        # Controller factories by mode (read self.transcriber at call time)
+        self._factories: dict[OperatingMode, Callable[[], CursorModeController]] = {
+            OperatingMode.CURSOR: lambda: CursorModeController(
+                self.config, self.hardware, self.transcriber,
+                on_text_ready=self._handle_text_output
+            ),
+        }
 
         # Callback for mode results
         self.on_text_output: Optional[Callable[[str], None]] = None
 
+    @staticmethod
+    def _get_transcriber_settings(config: UserConfig) -> tuple:
+        """Config fields the shared Transcriber is built from."""
+        return tuple(config.vocabulary), config.custom_whisper_model
+
+    def _rebuild_transcriber(self):
+        """Replace the shared transcriber on every cached controller (lock held)."""
+        self._transcriber_rebuild_pending = False
+        self._transcriber_settings = self._get_transcriber_settings(self.config)
+        self.transcriber = self._create_transcriber()
+        for controller in self._controllers.values():
+            controller.transcriber = self.transcriber
+        log.debug("Transcriber rebuilt for new vocabulary/model settings")
+
+    def _create_transcriber(self) -> Transcriber:
+        """Create the transcriber shared by all mode controllers."""
+        return Transcriber(
+            tier=self.hardware.tier,
+            custom_vocabulary=self.config.vocabulary
+        )
+
     def _create_controller(self, mode: OperatingMode) -> CursorModeController:
         """Create a controller for the specified mode."""
-        if mode == OperatingMode.CURSOR:
-            return CursorModeController(
-                self.config, self.hardware,
-                on_text_ready=self._handle_text_output
-            )
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
+        try:
+            factory = self._factories[mode]
+        except KeyError:
+            raise ValueError(f"Unknown mode: {mode}") from None
+        return factory()
+
+    def _get_controller(self, mode: OperatingMode) -> CursorModeController:
+        """Return the cached controller for a mode, creating it on first use."""
+        controller = self._controllers.get(mode)
+        if controller is None:
+            controller = self._create_controller(mode)
+            self._controllers[mode] = controller
+        return controller
+
+    def _dispose_controllers(self):
+        """Dispose and drop all cached controllers."""
+        for controller in self._controllers.values():
+            controller.dispose()
+        self._controllers.clear()
+        self._current_mode = None
+        self._current_controller = None
+
+    def update_config(self, config: UserConfig):
+        """
+        Apply a new config to the manager and its cached controllers.
+
+        The shared transcriber is rebuilt only when vocabulary or model
+        settings changed, and never while a recording is being captured or
+        transcribed; in that case the rebuild runs once it finishes.
+        """
+        with self._lock:
+            self.config = config
+            for controller in self._controllers.values():
+                controller.config = config
+
+            if self._get_transcriber_settings(config) == self._transcriber_settings:
+                return
+
+            if self._in_flight:
+                self._transcriber_rebuild_pending = True
+                log.debug("Deferring transcriber rebuild until recording finishes")
+            else:
+                self._rebuild_transcriber()
+
+    def shutdown(self):
+        """Stop any active mode and release all cached controllers."""
+        with self._lock:
+            self._dispose_controllers()
 
     def _handle_text_output(self, text: str):
         """Handle text output from modes."""
@@ -125,33 +241,41 @@ class ModeManager:
         if self._current_controller and self._current_controller.is_active:
             self.stop_current_mode()
 
-        try:
-            self._current_mode = mode
-            self._current_controller = self._create_controller(mode)
+        with self._lock:
+            try:
+                self._current_mode = mode
+                self._current_controller = self._get_controller(mode)
 
-            if app_context:
-                self._current_controller.set_app_context(app_context)
+                if app_context:
+                    self._current_controller.set_app_context(app_context)
 
-            self._current_controller.start()
-            return True
+                self._current_controller.start()
+                self._in_flight += 1
+                return True
 
-        except Exception as e:
-            log.error("ModeManager error starting mode: %s", e)
-            self._current_mode = None
-            self._current_controller = None
-            return False
+            except Exception as e:
+                log.error("ModeManager error starting mode: %s", e)
+                self._current_mode = None
+                self._current_controller = None
+                return False
 
     def stop_current_mode(self) -> Optional[ModeResult]:
         """Stop the currently active mode."""
-        if not self._current_controller:
-            return None
-
-        result = self._current_controller.stop()
+        with self._lock:
+            controller = self._current_controller
+            if not controller:
+                return None
 
-        self._current_mode = None
-        self._current_controller = None
+            self._current_mode = None
+            self._current_controller = None
 
-        return result
+        try:
+            return controller.stop()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if self._transcriber_rebuild_pending and not self._in_flight:
+                    self._rebuild_transcriber()
 
     def toggle_recording(self) -> bool:
         """Toggle recording for the current mode."""
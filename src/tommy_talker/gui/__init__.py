@@ -1,14 +1,36 @@
 """
 TommyTalker GUI Module
 PyQt6 classes for Menu Bar, Dashboard, and Setup Guide.
+
+Classes are imported lazily on first access (PEP 562) so importing the
+package does not pull in every window's widget tree.
 """
 
-from tommy_talker.gui.menu_bar import MenuBarApp
-from tommy_talker.gui.dashboard import DashboardWindow
-from tommy_talker.gui.setup_guide import SetupGuideWindow
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tommy_talker.gui.menu_bar import MenuBarApp
+    from tommy_talker.gui.dashboard import DashboardWindow
+    from tommy_talker.gui.setup_guide import SetupGuideWindow
+
+_LAZY_IMPORTS = {
+    "MenuBarApp": "tommy_talker.gui.menu_bar",
+    "DashboardWindow": "tommy_talker.gui.dashboard",
+    "SetupGuideWindow": "tommy_talker.gui.setup_guide",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "MenuBarApp",
-    "DashboardWindow",
-    "SetupGuideWindow",
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,8 @@ TommyTalker Dashboard Window
 Settings panel with vocabulary, logging, model selection, and session recording.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QRadioButton,
@@ -16,6 +18,50 @@ from tommy_talker.utils.config import UserConfig, BASE_DATA_DIR
 from tommy_talker.utils.hardware_detect import HardwareProfile
 
 
+# Display names for hardware tiers
+_TIER_LABEL = {1: "Basic", 2: "Standard", 3: "Pro"}
+
+# Shared style sheets
+_QSS_HINT = "color: gray; font-size: 11px;"
+_QSS_HINT_SMALL = "color: gray; font-size: 10px;"
+_QSS_SAVE_OK = "color: #28a745;"
+_QSS_SAVE_BUTTON = """
+    QPushButton {
+        background-color: #007bff;
+        color: white;
+        padding: 10px;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #0056b3;
+    }
+"""
+
+# Applied once to the replacement list container; rows are styled by objectName
+_REPLACEMENTS_QSS = """
+    QFrame#replacementRow, QFrame#replacementRow QLabel {
+        background: palette(base);
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QLabel#replacementArrow { color: #007bff; font-weight: bold; }
+    QPushButton#replacementDelete { border: none; color: #999; }
+    QPushButton#replacementDelete:hover { color: #dc3545; }
+"""
+
+
+def _parse_vocabulary(text: str) -> list[str]:
+    """Split comma-separated vocabulary, stripping each entry once and dropping blanks."""
+    return [word for word in (part.strip() for part in text.split(",")) if word]
+
+
+@lru_cache(maxsize=None)
+def _header_font() -> QFont:
+    """Header font, resolved once (needs a QApplication, so not built at import)."""
+    return QFont("Helvetica Neue", 18, QFont.Weight.Bold)
+
+
 class DashboardWindow(QMainWindow):
     """Main dashboard control panel."""
 
@@ -30,14 +76,31 @@ class DashboardWindow(QMainWindow):
         self.setWindowTitle("TommyTalker Settings")
         self.setMinimumSize(480, 620)
 
-        self._setup_ui()
+        # Widgets are built on first show; most sessions never open settings
+        self._ui_built = False
+
+        # Clears the "Settings saved!" message; restarting it cancels a pending clear
+        self._save_status_timer = QTimer(self)
+        self._save_status_timer.setSingleShot(True)
+        self._save_status_timer.timeout.connect(self._clear_save_status)
 
     def bring_to_front(self):
         """Show and bring window to foreground (needed with LSUIElement=True)."""
+        self._ensure_ui()
         self.show()
         self.raise_()
         self.activateWindow()
 
+    def showEvent(self, event):
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        """Build the settings UI the first time it is needed."""
+        if not self._ui_built:
+            self._ui_built = True
+            self._setup_ui()
+
     def _setup_ui(self):
         """Setup the single-page settings UI."""
         scroll = QScrollArea()
@@ -50,7 +113,7 @@ class DashboardWindow(QMainWindow):
 
         # Header
         header = QLabel(f"TommyTalker — Tier {self.hardware.tier}")
-        header.setFont(QFont("Helvetica Neue", 18, QFont.Weight.Bold))
+        header.setFont(_header_font())
         layout.addWidget(header)
 
         # Hardware info
@@ -58,7 +121,7 @@ class DashboardWindow(QMainWindow):
         hw_layout = QFormLayout(hw_group)
         hw_layout.addRow("Chip:", QLabel(self.hardware.chip_type))
         hw_layout.addRow("RAM:", QLabel(f"{self.hardware.ram_gb} GB"))
-        tier_label = "Pro" if self.hardware.tier == 3 else "Standard" if self.hardware.tier == 2 else "Basic"
+        tier_label = _TIER_LABEL.get(self.hardware.tier, "Basic")
         hw_layout.addRow("Tier:", QLabel(f"{self.hardware.tier} ({tier_label})"))
         layout.addWidget(hw_group)
 
@@ -67,7 +130,7 @@ class DashboardWindow(QMainWindow):
         whisper_layout = QVBoxLayout(whisper_group)
 
         whisper_info = QLabel("Models download automatically on first use from HuggingFace.")
-        whisper_info.setStyleSheet("color: gray; font-size: 11px;")
+        whisper_info.setStyleSheet(_QSS_HINT)
         whisper_info.setWordWrap(True)
         whisper_layout.addWidget(whisper_info)
 
@@ -97,7 +160,7 @@ class DashboardWindow(QMainWindow):
         session_layout = QVBoxLayout(session_group)
 
         session_info = QLabel("Record audio sessions to WAV files. Push-to-talk dictation is excluded from session recordings.")
-        session_info.setStyleSheet("color: gray; font-size: 11px;")
+        session_info.setStyleSheet(_QSS_HINT)
         session_info.setWordWrap(True)
         session_layout.addWidget(session_info)
 
@@ -142,14 +205,14 @@ class DashboardWindow(QMainWindow):
             'and select it here.'
         )
         system_hint.setOpenExternalLinks(True)
-        system_hint.setStyleSheet("color: gray; font-size: 10px;")
+        system_hint.setStyleSheet(_QSS_HINT_SMALL)
         system_hint.setWordWrap(True)
         session_layout.addWidget(system_hint)
 
         # Recordings folder
         recordings_path = BASE_DATA_DIR / "Recordings"
         rec_path_label = QLabel(f"Save location: {recordings_path}")
-        rec_path_label.setStyleSheet("color: gray; font-size: 10px;")
+        rec_path_label.setStyleSheet(_QSS_HINT_SMALL)
         rec_path_label.setWordWrap(True)
         session_layout.addWidget(rec_path_label)
 
@@ -168,7 +231,7 @@ class DashboardWindow(QMainWindow):
         vocab_layout.addWidget(vocab_header)
 
         vocab_info = QLabel("Words injected into Whisper's initial_prompt for better recognition:")
-        vocab_info.setStyleSheet("color: gray; font-size: 11px;")
+        vocab_info.setStyleSheet(_QSS_HINT)
         vocab_info.setWordWrap(True)
         vocab_layout.addWidget(vocab_info)
 
@@ -183,7 +246,7 @@ class DashboardWindow(QMainWindow):
         vocab_layout.addWidget(replace_header)
 
         replace_info = QLabel("Automatically fix words that speech-to-text gets wrong:")
-        replace_info.setStyleSheet("color: gray; font-size: 11px;")
+        replace_info.setStyleSheet(_QSS_HINT)
         replace_info.setWordWrap(True)
         vocab_layout.addWidget(replace_info)
 
@@ -202,13 +265,16 @@ class DashboardWindow(QMainWindow):
         input_row.addWidget(add_btn)
         vocab_layout.addLayout(input_row)
 
-        # Replacement list
-        self.replacements_list = QVBoxLayout()
+        # Replacement list (one stylesheet for all rows)
+        replacements_container = QWidget()
+        replacements_container.setStyleSheet(_REPLACEMENTS_QSS)
+        self.replacements_list = QVBoxLayout(replacements_container)
+        self.replacements_list.setContentsMargins(0, 0, 0, 0)
         self.replacements_list.setSpacing(4)
         self._replacement_rows: list[tuple[str, str, QWidget]] = []
         for original, replacement in self.config.word_replacements.items():
             self._add_replacement_row(original, replacement)
-        vocab_layout.addLayout(self.replacements_list)
+        vocab_layout.addWidget(replacements_container)
 
         layout.addWidget(vocab_group)
 
@@ -222,7 +288,7 @@ class DashboardWindow(QMainWindow):
 
         log_path = BASE_DATA_DIR / "logs"
         log_path_label = QLabel(f"Log location: {log_path}")
-        log_path_label.setStyleSheet("color: gray; font-size: 10px;")
+        log_path_label.setStyleSheet(_QSS_HINT_SMALL)
         log_path_label.setWordWrap(True)
         logging_layout.addWidget(log_path_label)
 
@@ -234,18 +300,7 @@ class DashboardWindow(QMainWindow):
 
         # Save button
         save_btn = QPushButton("Save Settings")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
+        save_btn.setStyleSheet(_QSS_SAVE_BUTTON)
         save_btn.clicked.connect(self._save_settings)
         layout.addWidget(save_btn)
 
@@ -275,20 +330,20 @@ class DashboardWindow(QMainWindow):
     def _add_replacement_row(self, original: str, replacement: str):
         """Add a visual row for a word replacement."""
         row = QFrame()
-        row.setStyleSheet("QFrame { background: palette(base); border-radius: 4px; padding: 4px; }")
+        row.setObjectName("replacementRow")
         row_layout = QHBoxLayout(row)
         row_layout.setContentsMargins(8, 4, 8, 4)
 
         orig_label = QLabel(original)
         orig_label.setMinimumWidth(120)
         arrow = QLabel("\u2192")
-        arrow.setStyleSheet("color: #007bff; font-weight: bold;")
+        arrow.setObjectName("replacementArrow")
         repl_label = QLabel(replacement)
         repl_label.setMinimumWidth(120)
 
         delete_btn = QPushButton("\u2715")
+        delete_btn.setObjectName("replacementDelete")
         delete_btn.setFixedSize(24, 24)
-        delete_btn.setStyleSheet("QPushButton { border: none; color: #999; } QPushButton:hover { color: #dc3545; }")
         delete_btn.clicked.connect(lambda: self._remove_replacement(original, row))
 
         row_layout.addWidget(orig_label)
@@ -334,7 +389,7 @@ class DashboardWindow(QMainWindow):
     def _save_settings(self):
         """Save all settings to config."""
         # Vocabulary
-        self.config.vocabulary = [v.strip() for v in self.vocab_edit.toPlainText().split(",") if v.strip()]
+        self.config.vocabulary = _parse_vocabulary(self.vocab_edit.toPlainText())
 
         # Word replacements
         self.config.word_replacements = {o: r for o, r, w in self._replacement_rows}
@@ -356,13 +411,22 @@ class DashboardWindow(QMainWindow):
         self.config_changed_signal.emit(self.config)
 
         self.save_status.setText("Settings saved!")
-        self.save_status.setStyleSheet("color: #28a745;")
-        QTimer.singleShot(3000, lambda: self.save_status.setText(""))
+        self.save_status.setStyleSheet(_QSS_SAVE_OK)
+        self._save_status_timer.start(3000)
+
+    def _clear_save_status(self):
+        """Clear the save confirmation message."""
+        self.save_status.setText("")
 
     def _open_folder(self, path):
-        """Open a folder in Finder."""
+        """Open a folder in Finder (fire-and-forget; never blocks the UI)."""
         import subprocess
         from pathlib import Path
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
-        subprocess.run(["open", str(path)])
+        subprocess.Popen(
+            ["open", str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
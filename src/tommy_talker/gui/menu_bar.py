@@ -107,31 +107,46 @@ class MenuBarApp(QObject):
 
         self.tray_icon.setContextMenu(menu)
 
+    @staticmethod
+    def _set_action_text(action: QAction, text: str):
+        """Set menu text only when it changes (setText relayouts the menu)."""
+        if action.text() != text:
+            action.setText(text)
+
     def set_session_recording_state(self, is_recording: bool):
         """Update UI for session recording state."""
         self._is_session_recording = is_recording
         if is_recording:
-            self.session_action.setText("Stop Session Recording")
-            self.status_action.setText("Session Recording...")
+            self._set_action_text(self.session_action, "Stop Session Recording")
+            self._set_action_text(self.status_action, "Session Recording...")
         else:
-            self.session_action.setText("Start Session Recording")
+            self._set_action_text(self.session_action, "Start Session Recording")
             if not self._any_recording:
-                self.status_action.setText("Idle")
+                self._set_action_text(self.status_action, "Idle")
 
     def set_recording_state(self, is_recording: bool):
         """Update status text for push-to-talk recording state."""
         if is_recording:
-            self.status_action.setText("Push-to-Talk...")
+            self._set_action_text(self.status_action, "Push-to-Talk...")
         elif self._is_session_recording:
-            self.status_action.setText("Session Recording...")
+            self._set_action_text(self.status_action, "Session Recording...")
         else:
-            self.status_action.setText("Idle")
+            self._set_action_text(self.status_action, "Idle")
 
     def set_any_recording_state(self, any_active: bool):
         """Update icon color based on any recording activity."""
+        if any_active == self._any_recording:
+            return
         self._any_recording = any_active
         self._setup_icon(recording=any_active)
 
+    def apply_state(self, state: dict):
+        """Apply a coalesced controller state update (AppController.state_changed)."""
+        ptt, session = state["ptt"], state["session"]
+        self.set_any_recording_state(ptt or session)
+        self.set_session_recording_state(session)
+        self.set_recording_state(ptt)
+
     def show(self):
         """Show the tray icon."""
         self.tray_icon.show()
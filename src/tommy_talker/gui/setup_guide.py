@@ -3,14 +3,99 @@ TommyTalker Setup Guide
 Permission wizard shown on first run if Microphone or Accessibility permissions are missing.
 """
 
+import html
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent
 from PyQt6.QtGui import QFont
 
-from tommy_talker.utils.permissions import PermissionStatus, check_permissions, open_system_preferences
+from tommy_talker.utils.permissions import (
+    PermissionStatus,
+    check_accessibility_permission,
+    check_microphone_permission,
+    open_system_preferences,
+)
+
+# Fallback poll interval; permissions are also re-checked whenever the
+# window is re-activated (e.g. the user returns from System Settings)
+PERMISSION_POLL_MS = 5000
+
+# One style sheet for the whole window; widgets are targeted by objectName
+_SETUP_QSS = """
+    QLabel#subtitle { color: #666666; }
+
+    QFrame#permissionCard, QFrame#permissionCard QLabel {
+        background-color: #f8f9fa;
+        border-radius: 10px;
+        border: 1px solid #dee2e6;
+    }
+    QLabel#statusGranted { color: #28a745; }
+    QLabel#cardBody { color: #495057; }
+
+    QPushButton#grantButton {
+        background-color: #007bff;
+        color: white;
+        border-radius: 5px;
+        padding: 6px 16px;
+        font-weight: 500;
+    }
+    QPushButton#grantButton:hover {
+        background-color: #0056b3;
+    }
+
+    QFrame#helpFrame, QFrame#helpFrame QLabel {
+        background-color: #fff3cd;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QLabel#helpText { color: #856404; }
+
+    QPushButton#continueButton {
+        background-color: #0066cc;
+        color: white;
+        border-radius: 8px;
+    }
+    QPushButton#continueButton:disabled {
+        background-color: #cccccc;
+        color: #888888;
+    }
+    QPushButton#continueButton:hover:!disabled {
+        background-color: #0055aa;
+    }
+"""
+
+
+@dataclass(slots=True)
+class PermissionCard:
+    """Widgets of a permission card that change once the permission is granted."""
+    frame: QFrame
+    top_layout: QHBoxLayout
+    status_widget: QWidget
+    body_label: QLabel
+    description: str
+
+
+def _card_body_html(description: str, instructions: Optional[str] = None) -> str:
+    """Description, followed by grant instructions while the permission is missing."""
+    body = html.escape(description)
+    if instructions:
+        body += (
+            '<br><i style="color: #6c757d; font-size: 11pt;">'
+            f"📋 {html.escape(instructions)}</i>"
+        )
+    return body
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Resolve a Helvetica Neue font once per (size, weight); QFont is copied on set."""
+    return QFont("Helvetica Neue", size, weight)
 
 
 class SetupGuideWindow(QMainWindow):
@@ -28,6 +113,7 @@ class SetupGuideWindow(QMainWindow):
     def __init__(self, initial_status: PermissionStatus):
         super().__init__()
         self.perm_status = initial_status
+        self._checking = False
         
         self.setWindowTitle("TommyTalker Setup")
         self.setFixedSize(550, 520)
@@ -39,15 +125,24 @@ class SetupGuideWindow(QMainWindow):
         
         self._setup_ui()
         
-        # Start polling for permission changes
+        # Slow fallback poll; activation events drive the fast path
         self.check_timer = QTimer()
         self.check_timer.timeout.connect(self._check_permissions)
-        self.check_timer.start(1000)  # Check every second
+        self.check_timer.start(PERMISSION_POLL_MS)
+
+    def changeEvent(self, event):
+        """Re-check permissions when the window regains focus."""
+        super().changeEvent(event)
+        if (event.type() == QEvent.Type.ActivationChange
+                and self.isActiveWindow()
+                and not self.perm_status.all_granted):
+            self._check_permissions()
         
     def _setup_ui(self):
         """Setup the permission wizard UI."""
         central = QWidget()
         self.setCentralWidget(central)
+        self.setStyleSheet(_SETUP_QSS)
         
         layout = QVBoxLayout(central)
         layout.setContentsMargins(30, 25, 30, 25)
@@ -55,63 +150,57 @@ class SetupGuideWindow(QMainWindow):
         
         # Header
         title = QLabel("🔐 TommyTalker Setup")
-        title.setFont(QFont("Helvetica Neue", 22, QFont.Weight.Bold))
+        title.setFont(_font(22, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         subtitle = QLabel("TommyTalker needs 2 permissions to function properly.")
-        subtitle.setFont(QFont("Helvetica Neue", 13))
-        subtitle.setStyleSheet("color: #666666;")
+        subtitle.setFont(_font(13))
+        subtitle.setObjectName("subtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
         
         layout.addSpacing(10)
         
         # Microphone permission
-        self.mic_frame = self._create_permission_card(
+        self.mic_card = self._create_permission_card(
             title="🎤 Microphone Access",
             description="Required to capture your voice for transcription.",
             instructions="Click 'Grant' → Find 'Terminal' or 'Python' → Toggle ON",
             is_granted=self.perm_status.microphone,
             on_grant_click=lambda: open_system_preferences("microphone")
         )
-        layout.addWidget(self.mic_frame)
+        layout.addWidget(self.mic_card.frame)
         
         # Accessibility permission
-        self.access_frame = self._create_permission_card(
+        self.access_card = self._create_permission_card(
             title="⌨️ Accessibility Access",
             description="Required for global hotkeys and typing text at your cursor.",
             instructions="Click 'Grant' → Click '+' → Add Terminal/Python → Toggle ON",
             is_granted=self.perm_status.accessibility,
             on_grant_click=lambda: open_system_preferences("accessibility")
         )
-        layout.addWidget(self.access_frame)
+        layout.addWidget(self.access_card.frame)
         
         layout.addSpacing(5)
         
         # Help text
         help_frame = QFrame()
-        help_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3cd;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        help_frame.setObjectName("helpFrame")
         help_layout = QVBoxLayout(help_frame)
         help_layout.setContentsMargins(15, 10, 15, 10)
         
         help_title = QLabel("💡 Can't find TommyTalker in the list?")
-        help_title.setFont(QFont("Helvetica Neue", 12, QFont.Weight.Bold))
+        help_title.setFont(_font(12, QFont.Weight.Bold))
         help_layout.addWidget(help_title)
         
         help_text = QLabel(
             "When running from Terminal, grant permissions to <b>Terminal.app</b> "
             "(or <b>iTerm.app</b>). When running the bundled .app, grant to <b>TommyTalker.app</b>."
         )
-        help_text.setFont(QFont("Helvetica Neue", 11))
+        help_text.setFont(_font(11))
         help_text.setWordWrap(True)
-        help_text.setStyleSheet("color: #856404;")
+        help_text.setObjectName("helpText")
         help_layout.addWidget(help_text)
         
         layout.addWidget(help_frame)
@@ -122,37 +211,18 @@ class SetupGuideWindow(QMainWindow):
         self.continue_btn = QPushButton("Continue")
         self.continue_btn.setEnabled(False)
         self.continue_btn.setMinimumHeight(44)
-        self.continue_btn.setFont(QFont("Helvetica Neue", 14, QFont.Weight.Medium))
-        self.continue_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border-radius: 8px;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #888888;
-            }
-            QPushButton:hover:!disabled {
-                background-color: #0055aa;
-            }
-        """)
+        self.continue_btn.setFont(_font(14, QFont.Weight.Medium))
+        self.continue_btn.setObjectName("continueButton")
         self.continue_btn.clicked.connect(self._on_continue)
         layout.addWidget(self.continue_btn)
         
     def _create_permission_card(self, title: str, description: str, 
                                  instructions: str, is_granted: bool, 
-                                 on_grant_click) -> QFrame:
+                                 on_grant_click) -> PermissionCard:
         """Create a permission status card with detailed instructions."""
         frame = QFrame()
         frame.setFrameShape(QFrame.Shape.StyledPanel)
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 10px;
-                border: 1px solid #dee2e6;
-            }
-        """)
+        frame.setObjectName("permissionCard")
         
         main_layout = QVBoxLayout(frame)
         main_layout.setContentsMargins(15, 12, 15, 12)
@@ -162,7 +232,7 @@ class SetupGuideWindow(QMainWindow):
         top_layout = QHBoxLayout()
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Helvetica Neue", 14, QFont.Weight.Bold))
+        title_label.setFont(_font(14, QFont.Weight.Bold))
         top_layout.addWidget(title_label)
         
         top_layout.addStretch()
@@ -170,86 +240,76 @@ class SetupGuideWindow(QMainWindow):
         # Status/action section
         if is_granted:
             status = QLabel("✅ Granted")
-            status.setFont(QFont("Helvetica Neue", 13, QFont.Weight.Medium))
-            status.setStyleSheet("color: #28a745;")
+            status.setFont(_font(13, QFont.Weight.Medium))
+            status.setObjectName("statusGranted")
             top_layout.addWidget(status)
-            frame._status_widget = status
+            status_widget = status
         else:
             grant_btn = QPushButton("Grant")
             grant_btn.setMinimumWidth(80)
-            grant_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #007bff;
-                    color: white;
-                    border-radius: 5px;
-                    padding: 6px 16px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #0056b3;
-                }
-            """)
+            grant_btn.setObjectName("grantButton")
             grant_btn.clicked.connect(on_grant_click)
             top_layout.addWidget(grant_btn)
-            frame._status_widget = grant_btn
+            status_widget = grant_btn
             
         main_layout.addLayout(top_layout)
         
-        # Description
-        desc_label = QLabel(description)
-        desc_label.setFont(QFont("Helvetica Neue", 12))
-        desc_label.setStyleSheet("color: #495057;")
-        desc_label.setWordWrap(True)
-        main_layout.addWidget(desc_label)
+        # Description + instructions (if not granted) in one rich-text label
+        body_label = QLabel(_card_body_html(description, None if is_granted else instructions))
+        body_label.setTextFormat(Qt.TextFormat.RichText)
+        body_label.setFont(_font(12))
+        body_label.setObjectName("cardBody")
+        body_label.setWordWrap(True)
+        main_layout.addWidget(body_label)
         
-        # Instructions (if not granted)
-        if not is_granted:
-            instr_label = QLabel(f"📋 {instructions}")
-            instr_label.setFont(QFont("Helvetica Neue", 11))
-            instr_label.setStyleSheet("color: #6c757d; font-style: italic;")
-            instr_label.setWordWrap(True)
-            main_layout.addWidget(instr_label)
-            frame._instr_widget = instr_label
-        else:
-            frame._instr_widget = None
-            
-        return frame
+        return PermissionCard(
+            frame=frame,
+            top_layout=top_layout,
+            status_widget=status_widget,
+            body_label=body_label,
+            description=description,
+        )
         
     def _check_permissions(self):
-        """Poll for permission changes."""
-        self.perm_status = check_permissions()
-        
-        # Update UI based on current status
-        self._update_permission_card(self.mic_frame, self.perm_status.microphone)
-        self._update_permission_card(self.access_frame, self.perm_status.accessibility)
+        """Poll for permission changes, re-probing only what is still missing."""
+        # Probes are slow TCC/AppleScript round-trips; skip overlapping calls
+        if self._checking:
+            return
+        if not self.perm_status.all_granted:
+            self._checking = True
+            try:
+                self.perm_status = PermissionStatus(
+                    microphone=self.perm_status.microphone or check_microphone_permission(),
+                    accessibility=self.perm_status.accessibility or check_accessibility_permission(),
+                )
+            finally:
+                self._checking = False
+            
+            # Update UI based on current status
+            self._update_permission_card(self.mic_card, self.perm_status.microphone)
+            self._update_permission_card(self.access_card, self.perm_status.accessibility)
         
         # Enable continue if all permissions granted
         if self.perm_status.all_granted:
             self.continue_btn.setEnabled(True)
             self.check_timer.stop()
             
-    def _update_permission_card(self, frame: QFrame, is_granted: bool):
+    def _update_permission_card(self, card: PermissionCard, is_granted: bool):
         """Update a permission card's status."""
-        if not hasattr(frame, '_status_widget'):
-            return
-            
-        status_widget = frame._status_widget
+        status_widget = card.status_widget
         
         if is_granted and isinstance(status_widget, QPushButton):
             # Replace button with checkmark
             status_widget.deleteLater()
             status = QLabel("✅ Granted")
-            status.setFont(QFont("Helvetica Neue", 13, QFont.Weight.Medium))
-            status.setStyleSheet("color: #28a745;")
+            status.setFont(_font(13, QFont.Weight.Medium))
+            status.setObjectName("statusGranted")
             
-            # Find the top layout and add the status
-            top_layout = frame.layout().itemAt(0).layout()
-            top_layout.addWidget(status)
-            frame._status_widget = status
+            card.top_layout.addWidget(status)
+            card.status_widget = status
             
-            # Hide instructions if present
-            if hasattr(frame, '_instr_widget') and frame._instr_widget:
-                frame._instr_widget.hide()
+            # Drop the grant instructions
+            card.body_label.setText(_card_body_html(card.description))
             
     def _on_continue(self):
         """Handle continue button click."""
@@ -113,14 +113,9 @@ def _wire_connections(app: QApplication, controller: AppController, menu_bar: Me
     # Session recording: menu button → controller
     menu_bar.session_recording_toggled_signal.connect(controller.toggle_session_recording)
 
-    # Session recording state → menu bar UI
-    controller.session_recording_changed.connect(menu_bar.set_session_recording_state)
-
-    # Push-to-talk recording state → menu bar status text
-    controller.recording_changed.connect(menu_bar.set_recording_state)
-
-    # Unified any-recording state → menu bar icon color
-    controller.any_recording_changed.connect(menu_bar.set_any_recording_state)
+    # Recording state (PTT + session, coalesced per transition) → menu bar
+    # status text, session action, and icon color in one pass
+    controller.state_changed.connect(menu_bar.apply_state)
 
     # Menu bar → Dashboard (bring to front for LSUIElement apps)
     menu_bar.open_dashboard_signal.connect(dashboard.bring_to_front)
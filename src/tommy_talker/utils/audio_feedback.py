@@ -44,6 +44,8 @@ class AudioFeedback:
         self._no_result_sounds = self._validate_pool(self.NO_RESULT_POOL)
         self._error_sounds = self._validate_pool(self.ERROR_POOL)
 
+        self._prewarmed = False
+
     def _validate_pool(self, pool: list[str]) -> list[Path]:
         """Filter a sound pool to only sounds that exist on the system."""
         valid = []
@@ -55,6 +57,19 @@ class AudioFeedback:
             log.warning("No sounds found from pool %s", pool)
         return valid
 
+    def prewarm(self):
+        """Read every pooled sound once so the first afplay hits the OS file cache."""
+        if self._prewarmed:
+            return
+
+        pools = (self._start_sounds, self._stop_sounds, self._no_result_sounds, self._error_sounds)
+        for path in {p for pool in pools for p in pool}:
+            try:
+                path.read_bytes()
+            except OSError as e:
+                log.debug("Could not prewarm %s: %s", path, e)
+        self._prewarmed = True
+
     def _next_sound(self, pool: list[Path], idx_attr: str) -> Path | None:
         """Get the next sound from a pool using round-robin."""
         if not pool:
@@ -5,6 +5,7 @@ User preferences, paths, and settings management.
 
 import json
 import logging
+import os
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 from typing import Optional
@@ -26,6 +27,9 @@ DEFAULT_VOCABULARY = [
     "TommyTalker",
 ]
 
+# Parsed config.json contents keyed by path -> (st_mtime_ns, data)
+_config_cache: dict[Path, tuple[int, dict]] = {}
+
 
 @dataclass
 class UserConfig:
@@ -64,6 +68,7 @@ class UserConfig:
     # Session recording
     session_audio_source: str = "mic"  # "mic", "system", "system_and_mic"
     session_system_device: Optional[str] = None  # Name of virtual audio device
+    session_audio_subtype: str = "PCM_16"  # WAV sample format: "PCM_16" or "FLOAT"
 
 
 def get_config_path() -> Path:
@@ -83,6 +88,29 @@ def ensure_data_dirs():
     log.debug("Data directories ensured at: %s", BASE_DATA_DIR)
 
 
+def invalidate_config_cache():
+    """Drop cached config file contents so the next load re-reads disk."""
+    _config_cache.clear()
+
+
+def _read_config_data(config_path: Path) -> dict:
+    """
+    Read and parse config.json, reusing the cached parse while the
+    file's mtime is unchanged.
+    """
+    mtime_ns = os.stat(config_path).st_mtime_ns
+
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(config_path, "r") as f:
+        data = json.load(f)
+
+    _config_cache[config_path] = (mtime_ns, data)
+    return data
+
+
 def load_config() -> UserConfig:
     """
     Load user configuration from disk.
@@ -95,22 +123,23 @@ def load_config() -> UserConfig:
         return UserConfig()
 
     try:
-        with open(config_path, "r") as f:
-            data = json.load(f)
+        data = _read_config_data(config_path)
 
+        # Copy mutable fields so callers never share the cached parse
         config = UserConfig(
             logging_enabled=data.get("logging_enabled", True),
             skip_onboarding=data.get("skip_onboarding", False),
-            vocabulary=data.get("vocabulary", DEFAULT_VOCABULARY),
-            hotkeys=data.get("hotkeys", DEFAULT_HOTKEYS),
+            vocabulary=list(data.get("vocabulary", DEFAULT_VOCABULARY)),
+            hotkeys=dict(data.get("hotkeys", DEFAULT_HOTKEYS)),
             default_mode=data.get("default_mode", "cursor"),
             recording_mode=data.get("recording_mode", "push_to_talk"),
             app_context_enabled=data.get("app_context_enabled", True),
             audio_feedback_variation=data.get("audio_feedback_variation", True),
-            word_replacements=data.get("word_replacements", {}),
+            word_replacements=dict(data.get("word_replacements", {})),
             custom_whisper_model=data.get("custom_whisper_model"),
             session_audio_source=data.get("session_audio_source", "mic"),
             session_system_device=data.get("session_system_device"),
+            session_audio_subtype=data.get("session_audio_subtype", "PCM_16"),
         )
 
         # Migrate old defaults to new defaults
@@ -137,6 +166,8 @@ def save_config(config: UserConfig) -> bool:
         with open(config_path, "w") as f:
             json.dump(asdict(config), f, indent=2)
 
+        invalidate_config_cache()
+
         log.debug("Saved to: %s", config_path)
         return True
 
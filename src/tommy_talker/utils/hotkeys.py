@@ -7,6 +7,7 @@ and standard key combos (e.g., Option+R) via CGEventTap.
 """
 
 import logging
+import time
 from typing import Callable, Optional
 from dataclasses import dataclass
 
@@ -108,6 +109,8 @@ class Hotkey:
     callback: Callable  # Called on key-down
     callback_up: Optional[Callable] = None  # Called on key-up (for push-to-talk)
     name: str = ""
+    debounce_ns: int = 0  # Minimum gap between key-down dispatches (0 = off)
+    last_fired_ns: int = 0
 
 
 class HotkeyManager:
@@ -165,9 +168,15 @@ class HotkeyManager:
         hotkey_str: str,
         callback: Callable,
         name: str = "",
-        callback_up: Optional[Callable] = None
+        callback_up: Optional[Callable] = None,
+        debounce_ns: int = 0
     ) -> bool:
-        """Register a global hotkey."""
+        """
+        Register a global hotkey.
+
+        If debounce_ns is set, key-down presses arriving within that window
+        of the last dispatched press are dropped before the callback runs.
+        """
         if not HAS_QUARTZ:
             log.warning("Cannot register '%s' - Quartz not available", hotkey_str)
             return False
@@ -178,7 +187,8 @@ class HotkeyManager:
         if key in MODIFIER_KEY_CODES:
             hotkey = Hotkey(
                 key=key, modifiers=[], callback=callback,
-                callback_up=callback_up, name=name or hotkey_str
+                callback_up=callback_up, name=name or hotkey_str,
+                debounce_ns=debounce_ns
             )
             self._modifier_hotkeys[key] = hotkey
             log.debug("Registered modifier-only: %s (%s)", hotkey_str, name)
@@ -193,7 +203,8 @@ class HotkeyManager:
 
         hotkey = Hotkey(
             key=key, modifiers=modifiers, callback=callback,
-            callback_up=callback_up, name=name or hotkey_str
+            callback_up=callback_up, name=name or hotkey_str,
+            debounce_ns=debounce_ns
         )
         self._hotkeys[hotkey_id] = hotkey
         log.debug("Registered: %s (%s)", hotkey_str, name)
@@ -222,6 +233,18 @@ class HotkeyManager:
                 return False
         return True
 
+    def _should_dispatch(self, hotkey: Hotkey) -> bool:
+        """Apply the hotkey's debounce window. Returns False to drop the press."""
+        if not hotkey.debounce_ns:
+            return True
+
+        now = time.monotonic_ns()
+        if now - hotkey.last_fired_ns < hotkey.debounce_ns:
+            return False
+
+        hotkey.last_fired_ns = now
+        return True
+
     def _event_callback(self, proxy, event_type, event, refcon):
         """Callback for Quartz event tap (key down/up)."""
         if self._event_tap and not CGEventTapIsEnabled(self._event_tap):
@@ -263,6 +286,9 @@ class HotkeyManager:
                         self._pressed_keys.add(hotkey_id)
                         self._pressed_key_codes[key_code] = hotkey_id
 
+                        if not self._should_dispatch(hotkey):
+                            return None  # Debounced, still consume
+
                         try:
                             hotkey.callback()
                         except Exception as e:
@@ -301,10 +327,11 @@ class HotkeyManager:
                     else:
                         # Key pressed
                         self._pressed_modifier_keys.add(keycode)
-                        try:
-                            hotkey.callback()
-                        except Exception as e:
-                            log.error("Modifier key-down error: %s", e)
+                        if self._should_dispatch(hotkey):
+                            try:
+                                hotkey.callback()
+                            except Exception as e:
+                                log.error("Modifier key-down error: %s", e)
                     break
 
         except Exception as e:
@@ -335,6 +362,23 @@ class HotkeyManager:
 
         return success
 
+    def sync_taps(self) -> bool:
+        """
+        Start any event tap needed by hotkeys registered while running.
+
+        Lets callers add or swap individual hotkeys without stop()/start();
+        taps that are no longer needed stay installed but match nothing.
+        """
+        if not self._running:
+            return False
+
+        success = True
+        if self._hotkeys and not self._event_tap:
+            success = self._start_key_tap()
+        if self._modifier_hotkeys and not self._modifier_tap:
+            success = self._start_modifier_tap() and success
+        return success
+
     def _start_key_tap(self) -> bool:
         """Start Quartz EventTap for key down/up events."""
         try:
@@ -73,3 +73,10 @@ def mock_hardware():
         tier=3,
         whisper_model="large-v3-turbo",
     )
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Shared QApplication for widget tests."""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
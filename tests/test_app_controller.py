@@ -0,0 +1,322 @@
+"""
+Tests for AppController signals, hotkeys, config updates, formatting, and device lookup.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from tommy_talker.app_controller import DEFAULT_INPUT_DEVICE, DEVICE_CACHE_TTL_S, AppController
+from tommy_talker.engine.modes import ModeResult, OperatingMode
+from tommy_talker.utils.app_context import AppContext, TextInputFormat
+
+
+@pytest.fixture
+def controller(mock_config, mock_hardware):
+    """AppController with the mode manager and audio feedback patched out."""
+    with patch("tommy_talker.app_controller.ModeManager") as mock_manager_cls, \
+         patch("tommy_talker.app_controller.get_audio_feedback"):
+        mock_manager = mock_manager_cls.return_value
+        mock_manager.is_recording = False
+        mock_manager.start_mode.return_value = True
+        mock_manager.stop_current_mode.return_value = ModeResult(success=True, text="hello")
+        yield AppController(mock_config, mock_hardware)
+
+
+def _record(signal) -> list:
+    calls = []
+    signal.connect(lambda *args: calls.append(args))
+    return calls
+
+
+class TestSignalBatching:
+    def test_start_recording_emits_each_signal_once(self, controller):
+        status = _record(controller.status_message)
+        changed = _record(controller.recording_changed)
+
+        controller.start_recording()
+
+        assert changed == [(True,)]
+        assert len(status) == 1
+        assert status[0][0].startswith("Recording")
+
+    def test_start_recording_emits_one_state_changed(self, controller):
+        states = _record(controller.state_changed)
+        controller.mode_manager.is_recording = True
+
+        controller.start_recording()
+
+        assert len(states) == 1
+        state = states[0][0]
+        assert state["ptt"] is True
+        assert state["session"] is False
+        assert state["status"].startswith("Recording")
+
+    def test_unbatched_status_emits_state_changed(self, controller):
+        states = _record(controller.state_changed)
+        controller._emit("status_message", "now")
+        assert states == [({"ptt": False, "session": False, "status": "now"},)]
+
+    def test_unbatched_state_signal_emits_state_changed(self, controller):
+        states = _record(controller.state_changed)
+        controller.mode_manager.is_recording = True
+
+        controller._emit("recording_changed", True)
+
+        assert states == [({"ptt": True, "session": False},)]
+
+    def test_unbatched_event_skips_state_changed(self, controller):
+        states = _record(controller.state_changed)
+        controller._emit("recording_started")
+        assert states == []
+
+    def test_nested_batch_keeps_every_status_in_order(self, controller):
+        status = _record(controller.status_message)
+
+        with controller._batch():
+            controller.set_mode(OperatingMode.CURSOR)
+            with controller._batch():
+                controller._emit("status_message", "inner")
+            assert status == []
+
+        assert status == [("Mode: Cursor",), ("inner",)]
+
+    def test_state_signals_coalesce_to_last_value(self, controller):
+        changed = _record(controller.recording_changed)
+
+        with controller._batch():
+            controller._emit("recording_changed", True)
+            controller._emit("recording_changed", False)
+
+        assert changed == [(False,)]
+
+    def test_events_are_not_coalesced(self, controller):
+        stopped = _record(controller.recording_stopped)
+        first, second = ModeResult(success=True, text="a"), ModeResult(success=True, text="b")
+
+        with controller._batch():
+            controller._emit("recording_stopped", first)
+            controller._emit("recording_stopped", second)
+
+        assert stopped == [(first,), (second,)]
+
+    def test_emit_outside_batch_is_immediate(self, controller):
+        status = _record(controller.status_message)
+        controller._emit("status_message", "now")
+        assert status == [("now",)]
+
+    def test_flush_after_exception(self, controller):
+        status = _record(controller.status_message)
+
+        with pytest.raises(RuntimeError):
+            with controller._batch():
+                controller._emit("status_message", "queued")
+                raise RuntimeError("boom")
+
+        assert status == [("queued",)]
+        assert controller._batch_depth == 0
+
+
+class TestStopRecording:
+    def test_truncated_recording_warns_user(self, controller):
+        status = _record(controller.status_message)
+        controller.mode_manager.stop_current_mode.return_value = ModeResult(
+            success=True, text="hello", metadata={"truncated": True}
+        )
+
+        controller.stop_recording()
+
+        assert status[-1][0].startswith("Recording limit reached")
+
+
+class TestPasteWorker:
+    def test_paste_runs_on_io_pool(self, controller):
+        paste_threads = []
+        done = threading.Event()
+
+        def fake_paste(text):
+            paste_threads.append(threading.current_thread())
+            done.set()
+            return True
+
+        with patch("tommy_talker.app_controller.paste_text", side_effect=fake_paste):
+            controller._on_text_output("hello")
+            assert done.wait(2)
+            controller._io_pool.waitForDone(1000)
+
+        assert paste_threads[0] is not threading.current_thread()
+
+    def test_paste_done_reports_status(self, controller):
+        status = _record(controller.status_message)
+        controller._on_paste_done(True)
+        controller._on_paste_done(False)
+        assert status == [("Text pasted",), ("Failed to paste text",)]
+
+
+class TestUpdateConfig:
+    @pytest.fixture
+    def patched(self, controller):
+        with patch.object(controller, "hotkey_manager") as mock_hotkeys, \
+             patch("tommy_talker.app_controller.save_config") as mock_save:
+            yield mock_hotkeys, mock_save
+
+    def test_unchanged_config_skips_save_and_hotkeys(self, controller, patched):
+        mock_hotkeys, mock_save = patched
+
+        controller.update_config(controller.config)
+
+        mock_save.assert_not_called()
+        mock_hotkeys.stop.assert_not_called()
+        controller.mode_manager.update_config.assert_not_called()
+
+    def test_vocabulary_edit_saves_without_hotkey_restart(self, controller, patched):
+        mock_hotkeys, mock_save = patched
+
+        controller.config.vocabulary.append("Qt")
+        controller.update_config(controller.config)
+
+        mock_save.assert_called_once_with(controller.config)
+        mock_hotkeys.stop.assert_not_called()
+
+    def test_hotkey_edit_reregisters_only_changed_binding(self, controller, patched):
+        mock_hotkeys, mock_save = patched
+        old = controller.config.hotkeys["cursor_mode"]
+
+        controller.config.hotkeys["cursor_mode"] = "LeftCmd"
+        controller.update_config(controller.config)
+
+        mock_hotkeys.stop.assert_not_called()
+        mock_hotkeys.unregister.assert_called_once_with(old)
+        assert [c.args[0] for c in mock_hotkeys.register.call_args_list] == ["LeftCmd"]
+        mock_hotkeys.sync_taps.assert_called_once()
+        mock_save.assert_called_once()
+
+    def test_recording_mode_change_reregisters_cursor_hotkey(self, controller, patched):
+        mock_hotkeys, _ = patched
+        cursor = controller.config.hotkeys["cursor_mode"]
+
+        controller.config.recording_mode = "toggle"
+        controller.update_config(controller.config)
+
+        mock_hotkeys.unregister.assert_called_once_with(cursor)
+        assert [c.args[0] for c in mock_hotkeys.register.call_args_list] == [cursor]
+
+    def test_swapped_bindings_unregister_before_register(self, controller, patched):
+        mock_hotkeys, _ = patched
+        hotkeys = controller.config.hotkeys
+        hotkeys["cursor_mode"], hotkeys["toggle_record"] = hotkeys["toggle_record"], hotkeys["cursor_mode"]
+
+        controller.update_config(controller.config)
+
+        calls = [c[0] for c in mock_hotkeys.method_calls if c[0] in ("register", "unregister")]
+        assert calls == ["unregister", "unregister", "register", "register"]
+
+
+class TestDeviceCache:
+    DEVICES = [
+        {"name": "Built-in Output", "max_input_channels": 0},
+        {"name": "MacBook Mic", "max_input_channels": 1},
+        {"name": "BlackHole 2ch", "max_input_channels": 2},
+    ]
+
+    def test_repeated_lookups_enumerate_once(self, controller):
+        with patch("tommy_talker.app_controller.sd.query_devices", return_value=self.DEVICES) as mock_query:
+            assert controller._resolve_device_index("BlackHole 2ch") == 2
+            assert controller._resolve_device_index("MacBook Mic") == 1
+
+        mock_query.assert_called_once()
+
+    def test_output_only_devices_are_skipped(self, controller):
+        with patch("tommy_talker.app_controller.sd.query_devices", return_value=self.DEVICES):
+            assert controller._resolve_device_index("Built-in Output") is None
+
+    def test_cache_expires_after_ttl(self, controller):
+        with patch("tommy_talker.app_controller.sd.query_devices", return_value=self.DEVICES) as mock_query, \
+             patch("tommy_talker.app_controller.time.monotonic", side_effect=[100.0, 100.0 + DEVICE_CACHE_TTL_S]):
+            controller._resolve_device_index("MacBook Mic")
+            controller._resolve_device_index("MacBook Mic")
+
+        assert mock_query.call_count == 2
+
+    def test_default_sentinel_resolves_to_default_input(self, controller):
+        with patch("tommy_talker.app_controller.sd.query_devices", return_value=self.DEVICES), \
+             patch("tommy_talker.app_controller.sd.default") as mock_default:
+            mock_default.device = (1, 0)
+            assert controller._resolve_device_index(DEFAULT_INPUT_DEVICE) == 1
+
+    def test_no_default_input_leaves_sentinel_unresolved(self, controller):
+        with patch("tommy_talker.app_controller.sd.query_devices", return_value=self.DEVICES), \
+             patch("tommy_talker.app_controller.sd.default") as mock_default:
+            mock_default.device = (-1, 0)
+            assert controller._resolve_device_index(DEFAULT_INPUT_DEVICE) is None
+
+    def test_invalidate_forces_requery(self, controller):
+        with patch("tommy_talker.app_controller.sd.query_devices", return_value=self.DEVICES) as mock_query:
+            controller._resolve_device_index("MacBook Mic")
+            controller.invalidate_device_cache()
+            controller._resolve_device_index("MacBook Mic")
+
+        assert mock_query.call_count == 2
+
+
+class TestOutputFormatting:
+    def _format(self, controller, fmt: TextInputFormat, text: str) -> str:
+        controller._app_context = AppContext(
+            app_name="Terminal", bundle_id="com.apple.Terminal", profile=None, text_input_format=fmt
+        )
+        return controller._apply_output_formatting(text)
+
+    def test_terminal_command_strips_fillers(self, controller):
+        text = self._format(controller, TextInputFormat.TERMINAL_COMMAND, "Um, could you please run git status.")
+        assert text == "run git status"
+
+    def test_terminal_command_keeps_words_containing_fillers(self, controller):
+        text = self._format(controller, TextInputFormat.TERMINAL_COMMAND, "summary unlike sort")
+        assert text == "summary unlike sort"
+
+    def test_search_query_collapses_whitespace(self, controller):
+        text = self._format(controller, TextInputFormat.SEARCH_QUERY, "  best \t pizza\n near me . ")
+        assert text == "best pizza near me"
+
+    def test_url_removes_all_whitespace(self, controller):
+        text = self._format(controller, TextInputFormat.URL, "example .com/\tpath\n")
+        assert text == "example.com/path"
+
+    def test_no_context_returns_text_unchanged(self, controller):
+        controller._app_context = None
+        assert controller._apply_output_formatting("  um hi ") == "  um hi "
+
+
+class TestAudioFeedbackBinding:
+    def test_session_recording_uses_bound_player(self, controller, tmp_path):
+        with patch("tommy_talker.app_controller.SessionRecorder") as mock_recorder_cls, \
+             patch("tommy_talker.app_controller.get_audio_feedback") as mock_get:
+            mock_recorder = mock_recorder_cls.return_value
+            mock_recorder.start.return_value = tmp_path / "session.wav"
+            mock_recorder.stop.return_value = tmp_path / "session.wav"
+            mock_recorder.is_recording = True
+
+            controller.start_session_recording()
+            controller.stop_session_recording()
+
+        mock_get.assert_not_called()
+        controller._audio_fb.play_start.assert_called_once()
+        controller._audio_fb.play_stop.assert_called_once()
+
+
+class TestHotkeyHandlers:
+    def test_dashboard_hotkey_registered_as_bound_method(self, mock_config, mock_hardware):
+        with patch("tommy_talker.app_controller.ModeManager"), \
+             patch("tommy_talker.app_controller.get_audio_feedback"), \
+             patch("tommy_talker.app_controller.HotkeyManager") as mock_hotkeys_cls:
+            mock_config.hotkeys["open_dashboard"] = "Cmd+Shift+D"
+            controller = AppController(mock_config, mock_hardware)
+
+        callbacks = {c.args[2]: c.args[1] for c in mock_hotkeys_cls.return_value.register.call_args_list}
+        assert callbacks["Open Dashboard"] == controller._on_dashboard_hotkey
+
+    def test_dashboard_hotkey_emits_status(self, controller):
+        status = _record(controller.status_message)
+        controller._on_dashboard_hotkey()
+        assert status == [("Opening dashboard...",)]
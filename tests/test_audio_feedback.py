@@ -125,3 +125,24 @@ class TestGlobalInstance:
         a = get_audio_feedback()
         b = get_audio_feedback()
         assert a is b
+
+
+class TestPrewarm:
+    """Test sound file prewarming."""
+
+    def test_prewarm_reads_each_sound_once(self, tmp_path):
+        sound = tmp_path / "Blow.aiff"
+        sound.write_bytes(b"FORM")
+        with patch.object(AudioFeedback, "SYSTEM_SOUNDS", tmp_path):
+            af = AudioFeedback(enabled=False)
+
+        with patch.object(Path, "read_bytes", autospec=True) as mock_read:
+            af.prewarm()
+            af.prewarm()
+
+        mock_read.assert_called_once_with(sound)
+
+    def test_prewarm_tolerates_missing_files(self, tmp_path):
+        af = AudioFeedback(enabled=False)
+        af._start_sounds = [tmp_path / "Gone.aiff"]
+        af.prewarm()  # Should not raise
@@ -0,0 +1,68 @@
+"""
+Tests for configuration loading, saving, and the parsed-config cache.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tommy_talker.utils import config as config_module
+from tommy_talker.utils.config import (
+    UserConfig,
+    invalidate_config_cache,
+    load_config,
+    save_config,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Point BASE_DATA_DIR at a temp dir and start with an empty cache."""
+    monkeypatch.setattr("tommy_talker.utils.config.BASE_DATA_DIR", tmp_path)
+    invalidate_config_cache()
+    yield tmp_path
+    invalidate_config_cache()
+
+
+class TestConfigCache:
+    def test_repeated_load_skips_json_parse(self, config_dir):
+        save_config(UserConfig(vocabulary=["Alpha"]))
+
+        with patch.object(config_module.json, "load", wraps=json.load) as mock_load:
+            load_config()
+            load_config()
+
+        assert mock_load.call_count == 1
+
+    def test_save_invalidates_cache(self, config_dir):
+        save_config(UserConfig(vocabulary=["Alpha"]))
+        assert load_config().vocabulary == ["Alpha"]
+
+        save_config(UserConfig(vocabulary=["Beta"]))
+        assert load_config().vocabulary == ["Beta"]
+
+    def test_external_edit_detected_by_mtime(self, config_dir):
+        save_config(UserConfig(vocabulary=["Alpha"]))
+        load_config()
+
+        config_path = config_dir / "config.json"
+        data = json.loads(config_path.read_text())
+        data["vocabulary"] = ["Edited"]
+        config_path.write_text(json.dumps(data))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config().vocabulary == ["Edited"]
+
+    def test_loaded_configs_do_not_share_mutable_state(self, config_dir):
+        save_config(UserConfig(word_replacements={"tommy": "Tommy"}))
+
+        first = load_config()
+        first.word_replacements["extra"] = "Extra"
+        first.vocabulary.append("Extra")
+
+        second = load_config()
+        assert "extra" not in second.word_replacements
+        assert "Extra" not in second.vocabulary
@@ -0,0 +1,94 @@
+"""
+Tests for the DashboardWindow settings panel.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from tommy_talker.gui.dashboard import DashboardWindow, _parse_vocabulary
+
+
+@pytest.fixture
+def dashboard(qapp, mock_config, mock_hardware):
+    window = DashboardWindow(mock_config, mock_hardware)
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+class TestLazyBuild:
+    def test_ui_not_built_on_construction(self, dashboard):
+        assert dashboard._ui_built is False
+        assert not hasattr(dashboard, "vocab_edit")
+
+    def test_bring_to_front_builds_ui_once(self, dashboard):
+        with patch.object(DashboardWindow, "_setup_ui", autospec=True,
+                          side_effect=DashboardWindow._setup_ui) as mock_setup:
+            dashboard.bring_to_front()
+            dashboard.bring_to_front()
+
+        mock_setup.assert_called_once()
+        assert dashboard.vocab_edit.toPlainText() == "TommyTalker, mlx-whisper"
+
+
+class TestReplacementRows:
+    def test_rows_styled_by_shared_stylesheet(self, dashboard):
+        dashboard._ensure_ui()
+        dashboard._add_replacement_row("tommy", "Tommy")
+
+        _, _, row = dashboard._replacement_rows[-1]
+        assert row.objectName() == "replacementRow"
+        assert row.styleSheet() == ""
+        assert "replacementRow" in row.parentWidget().styleSheet()
+
+    def test_remove_row(self, dashboard):
+        dashboard._ensure_ui()
+        dashboard._add_replacement_row("tommy", "Tommy")
+        _, _, row = dashboard._replacement_rows[-1]
+
+        dashboard._remove_replacement("tommy", row)
+
+        assert all(w is not row for _, _, w in dashboard._replacement_rows)
+
+
+class TestParseVocabulary:
+    def test_strips_and_drops_blanks(self):
+        assert _parse_vocabulary(" Alpha , ,Beta,\n Gamma ,") == ["Alpha", "Beta", "Gamma"]
+
+    def test_empty_text(self):
+        assert _parse_vocabulary("") == []
+
+
+class TestSaveSettings:
+    def test_repeated_saves_reuse_one_timer(self, dashboard):
+        dashboard._ensure_ui()
+        timer = dashboard._save_status_timer
+
+        dashboard._save_settings()
+        dashboard._save_settings()
+
+        assert dashboard._save_status_timer is timer
+        assert timer.isActive()
+        assert dashboard.save_status.text() == "Settings saved!"
+
+    def test_timer_clears_status(self, dashboard):
+        dashboard._ensure_ui()
+        dashboard._save_settings()
+
+        dashboard._save_status_timer.timeout.emit()
+
+        assert dashboard.save_status.text() == ""
+
+
+class TestOpenFolder:
+    def test_open_folder_does_not_wait(self, dashboard, tmp_path):
+        target = tmp_path / "Recordings"
+        with patch("subprocess.Popen") as mock_popen, \
+             patch("subprocess.run") as mock_run:
+            dashboard._open_folder(target)
+
+        assert target.is_dir()
+        mock_run.assert_not_called()
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["open", str(target)]
@@ -0,0 +1,85 @@
+"""
+Tests for lazy package-level imports (PEP 562).
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter so sys.modules starts clean."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, env=env,
+    )
+    return result.stdout.strip()
+
+
+class TestGuiLazyImports:
+    def test_import_package_skips_windows(self):
+        out = _run(
+            "import sys, tommy_talker.gui; "
+            "print(any(m in sys.modules for m in ("
+            "'tommy_talker.gui.dashboard', 'tommy_talker.gui.setup_guide', "
+            "'tommy_talker.gui.menu_bar')))"
+        )
+        assert out == "False"
+
+    def test_attribute_access_imports_submodule(self):
+        from tommy_talker import gui
+        from tommy_talker.gui.dashboard import DashboardWindow
+
+        assert gui.DashboardWindow is DashboardWindow
+
+    def test_unknown_attribute_raises(self):
+        from tommy_talker import gui
+
+        with pytest.raises(AttributeError):
+            gui.HUDOverlay
+
+
+class TestEngineLazyImports:
+    def test_import_package_skips_transcriber(self):
+        out = _run(
+            "import sys, tommy_talker.engine; "
+            "print(any(m in sys.modules for m in ("
+            "'tommy_talker.engine.transcriber', 'tommy_talker.engine.modes')))"
+        )
+        assert out == "False"
+
+    def test_every_export_resolves(self):
+        from tommy_talker import engine
+
+        for name in engine.__all__:
+            assert getattr(engine, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        from tommy_talker import engine
+
+        with pytest.raises(AttributeError):
+            engine.RAGStore
+
+
+class TestPackageLazyImports:
+    def test_import_package_loads_no_submodules(self):
+        out = _run(
+            "import sys, tommy_talker; "
+            "print(sorted(m for m in sys.modules if m.startswith('tommy_talker.')))"
+        )
+        assert out == "[]"
+
+    def test_every_export_resolves(self):
+        import tommy_talker
+
+        for name in tommy_talker.__all__:
+            assert getattr(tommy_talker, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        import tommy_talker
+
+        with pytest.raises(AttributeError):
+            tommy_talker.Diarizer
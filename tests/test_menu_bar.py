@@ -0,0 +1,71 @@
+"""
+Tests for MenuBarApp state updates.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from PyQt6.QtGui import QAction
+
+from tommy_talker.gui.menu_bar import MenuBarApp
+
+
+@pytest.fixture
+def menu_bar(qapp, mock_config, mock_hardware):
+    return MenuBarApp(mock_config, mock_hardware)
+
+
+class TestStatusText:
+    def test_recording_state_updates_status(self, menu_bar):
+        menu_bar.set_recording_state(True)
+        assert menu_bar.status_action.text() == "Push-to-Talk..."
+
+        menu_bar.set_recording_state(False)
+        assert menu_bar.status_action.text() == "Idle"
+
+    def test_unchanged_text_skips_set_text(self, menu_bar):
+        with patch.object(QAction, "setText") as mock_set_text:
+            menu_bar.set_recording_state(False)
+            menu_bar.set_session_recording_state(False)
+
+        mock_set_text.assert_not_called()
+
+    def test_session_state_updates_both_actions(self, menu_bar):
+        menu_bar.set_session_recording_state(True)
+        assert menu_bar.session_action.text() == "Stop Session Recording"
+        assert menu_bar.status_action.text() == "Session Recording..."
+
+
+class TestIconState:
+    def test_unchanged_state_skips_icon_redraw(self, menu_bar):
+        with patch.object(menu_bar, "_setup_icon") as mock_setup:
+            menu_bar.set_any_recording_state(False)
+        mock_setup.assert_not_called()
+
+    def test_state_change_redraws_icon(self, menu_bar):
+        with patch.object(menu_bar, "_setup_icon") as mock_setup:
+            menu_bar.set_any_recording_state(True)
+            menu_bar.set_any_recording_state(True)
+        mock_setup.assert_called_once_with(recording=True)
+
+
+class TestApplyState:
+    def test_ptt_state(self, menu_bar):
+        menu_bar.apply_state({"ptt": True, "session": False})
+        assert menu_bar.status_action.text() == "Push-to-Talk..."
+        assert menu_bar._any_recording is True
+
+    def test_session_state(self, menu_bar):
+        menu_bar.apply_state({"ptt": False, "session": True, "status": "Session recording started"})
+        assert menu_bar.session_action.text() == "Stop Session Recording"
+        assert menu_bar.status_action.text() == "Session Recording..."
+
+    def test_idle_state_redraws_icon_once(self, menu_bar):
+        menu_bar.apply_state({"ptt": True, "session": False})
+        with patch.object(menu_bar, "_setup_icon") as mock_setup:
+            menu_bar.apply_state({"ptt": False, "session": False})
+            menu_bar.apply_state({"ptt": False, "session": False})
+
+        mock_setup.assert_called_once_with(recording=False)
+        assert menu_bar.status_action.text() == "Idle"
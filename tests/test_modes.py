@@ -0,0 +1,151 @@
+"""
+Tests for ModeManager controller lifecycle.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from tommy_talker.engine.modes import ModeManager, ModeResult, OperatingMode
+
+
+@pytest.fixture
+def manager(mock_config, mock_hardware):
+    """ModeManager with the recorder and transcriber patched out."""
+    with patch("tommy_talker.engine.modes.Recorder") as mock_recorder_cls, \
+         patch("tommy_talker.engine.modes.Transcriber") as mock_transcriber_cls:
+        mock_recorder_cls.return_value.stop.return_value = np.zeros(1600, dtype=np.float32)
+        mock_recorder_cls.return_value.is_recording = False
+        mock_recorder_cls.return_value.truncated = False
+        mock_transcriber_cls.side_effect = lambda **kwargs: MagicMock(
+            transcribe_audio=MagicMock(return_value=MagicMock(text="hello", duration=0.1))
+        )
+        yield ModeManager(mock_config, mock_hardware)
+
+
+class TestControllerCache:
+    def test_controller_reused_across_recordings(self, manager):
+        manager.start_mode(OperatingMode.CURSOR)
+        first = manager._current_controller
+        manager.stop_current_mode()
+
+        manager.start_mode(OperatingMode.CURSOR)
+        assert manager._current_controller is first
+
+    def test_update_config_keeps_cached_controllers(self, manager, mock_config):
+        manager.start_mode(OperatingMode.CURSOR)
+        first = manager._current_controller
+        manager.stop_current_mode()
+
+        manager.update_config(mock_config)
+        manager.start_mode(OperatingMode.CURSOR)
+        assert manager._current_controller is first
+        assert first.config is mock_config
+
+    def test_update_config_during_recording_keeps_recording(self, manager, mock_config):
+        manager.start_mode(OperatingMode.CURSOR)
+
+        manager.update_config(mock_config)
+
+        assert manager.is_recording is True
+        result = manager.stop_current_mode()
+        assert result is not None
+        assert result.text == "hello"
+
+    def test_stop_after_dispose_reports_error(self, manager):
+        manager.start_mode(OperatingMode.CURSOR)
+        controller = manager._current_controller
+        controller.transcriber = None
+
+        result = controller.stop()
+
+        assert result.success is False
+        assert result.error == "Transcriber unavailable"
+
+    def test_shutdown_disposes_controllers(self, manager):
+        manager.start_mode(OperatingMode.CURSOR)
+        controller = manager._current_controller
+
+        manager.shutdown()
+
+        assert manager.is_recording is False
+        assert manager._controllers == {}
+        assert controller.transcriber is None
+
+    def test_stop_returns_result(self, manager):
+        manager.start_mode(OperatingMode.CURSOR)
+        result = manager.stop_current_mode()
+
+        assert result.success is True
+        assert result.text == "hello"
+        assert manager.is_recording is False
+
+
+class TestSharedTranscriber:
+    def test_controllers_share_manager_transcriber(self, manager):
+        manager.start_mode(OperatingMode.CURSOR)
+        assert manager._current_controller.transcriber is manager.transcriber
+
+    def test_unrelated_config_change_keeps_transcriber(self, manager, mock_config):
+        original = manager.transcriber
+        mock_config.hotkeys["cursor_mode"] = "LeftCmd"
+        mock_config.session_audio_source = "system"
+
+        manager.update_config(mock_config)
+
+        assert manager.transcriber is original
+
+    def test_vocabulary_change_rebuilds_transcriber(self, manager, mock_config):
+        original = manager.transcriber
+        mock_config.vocabulary.append("PyQt6")
+
+        manager.update_config(mock_config)
+
+        assert manager.transcriber is not original
+
+    def test_rebuild_deferred_until_recording_stops(self, manager, mock_config):
+        manager.start_mode(OperatingMode.CURSOR)
+        controller = manager._current_controller
+        original = manager.transcriber
+
+        mock_config.vocabulary.append("PyQt6")
+        manager.update_config(mock_config)
+        assert manager.transcriber is original
+        assert controller.transcriber is original
+
+        manager.stop_current_mode()
+        original.transcribe_audio.assert_called_once()
+        assert manager.transcriber is not original
+        assert controller.transcriber is manager.transcriber
+
+
+class TestControllerFactories:
+    def test_unknown_mode_raises_value_error(self, manager):
+        with pytest.raises(ValueError):
+            manager._create_controller("editor")
+
+    def test_factory_uses_current_transcriber(self, manager, mock_config):
+        manager.update_config(mock_config)
+        controller = manager._create_controller(OperatingMode.CURSOR)
+        assert controller.transcriber is manager.transcriber
+
+
+class TestSlots:
+    def test_mode_result_has_no_instance_dict(self):
+        result = ModeResult(success=True, text="hi")
+        assert not hasattr(result, "__dict__")
+
+    def test_controller_rejects_unknown_attributes(self, manager):
+        controller = manager._create_controller(OperatingMode.CURSOR)
+        with pytest.raises(AttributeError):
+            controller.unexpected = True
+
+
+class TestOperatingModeFromValue:
+    def test_known_value(self):
+        assert OperatingMode.from_value("cursor") is OperatingMode.CURSOR
+
+    def test_unknown_value_raises_value_error(self):
+        with pytest.raises(ValueError):
+            OperatingMode.from_value("meeting")
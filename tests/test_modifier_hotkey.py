@@ -2,12 +2,15 @@
 Tests for modifier-only hotkey support (e.g., Right Command key).
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from tommy_talker.utils.hotkeys import (
     MODIFIER_KEY_CODES,
     MODIFIER_KEY_NAMES,
     is_modifier_only_hotkey,
+    Hotkey,
     HotkeyManager,
 )
 
@@ -141,3 +144,64 @@ class TestModifierHotkeyRegistration:
             hotkey = mgr._modifier_hotkeys["right_cmd"]
             assert hotkey.callback is down
             assert hotkey.callback_up is up
+
+
+class TestHotkeyDebounce:
+    """Test debounce applied before hotkey callbacks are dispatched."""
+
+    def _hotkey(self, debounce_ns: int) -> Hotkey:
+        return Hotkey(key="r", modifiers=["alt"], callback=lambda: None,
+                      debounce_ns=debounce_ns)
+
+    def test_no_debounce_always_dispatches(self):
+        mgr = HotkeyManager()
+        hotkey = self._hotkey(0)
+        assert mgr._should_dispatch(hotkey) is True
+        assert mgr._should_dispatch(hotkey) is True
+
+    def test_press_within_window_dropped(self):
+        mgr = HotkeyManager()
+        hotkey = self._hotkey(500_000_000)
+        with patch("tommy_talker.utils.hotkeys.time.monotonic_ns",
+                   side_effect=[1_000_000_000, 1_200_000_000]):
+            assert mgr._should_dispatch(hotkey) is True
+            assert mgr._should_dispatch(hotkey) is False
+
+    def test_press_after_window_dispatched(self):
+        mgr = HotkeyManager()
+        hotkey = self._hotkey(500_000_000)
+        with patch("tommy_talker.utils.hotkeys.time.monotonic_ns",
+                   side_effect=[1_000_000_000, 1_600_000_000]):
+            assert mgr._should_dispatch(hotkey) is True
+            assert mgr._should_dispatch(hotkey) is True
+
+
+class TestSyncTaps:
+    """Test starting taps for hotkeys registered while running."""
+
+    def test_not_running_is_noop(self):
+        mgr = HotkeyManager()
+        assert mgr.sync_taps() is False
+
+    def test_starts_missing_modifier_tap(self):
+        mgr = HotkeyManager()
+        mgr._running = True
+        mgr._modifier_hotkeys["right_cmd"] = Hotkey(key="right_cmd", modifiers=[], callback=lambda: None)
+
+        with patch.object(mgr, "_start_modifier_tap", return_value=True) as mock_mod, \
+             patch.object(mgr, "_start_key_tap") as mock_key:
+            assert mgr.sync_taps() is True
+
+        mock_mod.assert_called_once()
+        mock_key.assert_not_called()
+
+    def test_existing_tap_not_restarted(self):
+        mgr = HotkeyManager()
+        mgr._running = True
+        mgr._event_tap = object()
+        mgr._hotkeys["alt+r"] = Hotkey(key="r", modifiers=["alt"], callback=lambda: None)
+
+        with patch.object(mgr, "_start_key_tap") as mock_key:
+            mgr.sync_taps()
+
+        mock_key.assert_not_called()
@@ -0,0 +1,282 @@
+"""
+Tests for the in-memory push-to-talk Recorder and its ring buffer.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from tommy_talker.engine.audio_capture import (
+    AudioCapture,
+    AudioChunk,
+    Recorder,
+    RingBuffer,
+    SessionRecorder,
+)
+
+
+def _feed(capture: AudioCapture, indata: np.ndarray):
+    capture._audio_callback(indata, len(indata), None, None)
+
+
+def _start(rec: Recorder) -> AudioCapture:
+    with patch.object(AudioCapture, "start"):
+        rec.start()
+    rec._capture._is_recording = True
+    return rec._capture
+
+
+def _stop(rec: Recorder):
+    with patch.object(AudioCapture, "stop"):
+        return rec.stop()
+
+
+def _feed_blocks(capture: AudioCapture, samples: np.ndarray, block: int):
+    """Feed samples block by block, giving the grower thread time to keep up."""
+    ring = capture.ring
+    for i in range(0, len(samples), block):
+        _feed(capture, samples[i:i + block].reshape(-1, 1))
+        deadline = time.monotonic() + 5
+        while (ring._spare is None and ring.capacity < ring.max_capacity
+               and ring.available > ring.capacity * RingBuffer.GROW_AT
+               and time.monotonic() < deadline):
+            time.sleep(0.001)
+
+
+class TestRingBuffer:
+    def test_read_returns_written_samples(self):
+        ring = RingBuffer(8)
+        ring.write(np.arange(3, dtype=np.float32))
+        ring.write(np.arange(3, 5, dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.read(0), [0, 1, 2, 3, 4])
+
+    def test_wraparound(self):
+        ring = RingBuffer(4)
+        ring.write(np.arange(3, dtype=np.float32))
+        start = ring.write_idx
+        ring.write(np.arange(10, 13, dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.read(start), [10, 11, 12])
+
+    def test_overrun_keeps_newest_samples(self):
+        ring = RingBuffer(4)
+        ring.write(np.arange(6, dtype=np.float32))
+
+        assert ring.write_idx == 6
+        np.testing.assert_array_equal(ring.read(0), [2, 3, 4, 5])
+
+    def test_read_returns_owned_copy(self):
+        ring = RingBuffer(4)
+        ring.write(np.arange(3, dtype=np.float32))
+        start = ring.write_idx - 3
+
+        audio = ring.read(start)
+        ring.write(np.full(4, 9, dtype=np.float32))
+
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, [0, 1, 2])
+
+    def test_available_tracks_consumer_index(self):
+        ring = RingBuffer(8)
+        ring.write(np.ones(5, dtype=np.float32))
+        assert ring.available == 5
+
+        ring.read_idx += 3
+        assert ring.available == 2
+
+    def test_read_empty_range(self):
+        ring = RingBuffer(4)
+        assert ring.read(0).shape == (0,)
+
+    def test_write_zeros_and_read_into(self):
+        ring = RingBuffer(4)
+        ring.write(np.ones(3, dtype=np.float32))
+        ring.write_zeros(2)
+
+        out = np.empty(4, dtype=np.float32)
+        ring.read_into(1, out)
+        np.testing.assert_array_equal(out, [1, 1, 0, 0])
+
+
+class TestBoundedRingBuffer:
+    def test_requests_growth_past_high_water(self):
+        ring = RingBuffer(4, max_capacity=16)
+        ring.write(np.arange(2, dtype=np.float32))
+        assert not ring.grow_requested.is_set()
+
+        ring.write(np.arange(2, 3, dtype=np.float32))
+        assert ring.grow_requested.is_set()
+
+    def test_write_swaps_in_prepared_buffer(self):
+        ring = RingBuffer(4, max_capacity=16)
+        ring.write(np.arange(3, dtype=np.float32))
+        ring.prepare_growth()
+        assert ring.capacity == 4
+
+        ring.write(np.arange(3, 8, dtype=np.float32))
+
+        assert ring.capacity == 8
+        assert ring.dropped == 0
+        np.testing.assert_array_equal(ring.read(0), np.arange(8))
+
+    def test_growth_preserves_wrapped_unconsumed_samples(self):
+        ring = RingBuffer(4, max_capacity=16)
+        ring.write(np.arange(3, dtype=np.float32))
+        ring.read_idx = 2
+        ring.write(np.arange(3, 5, dtype=np.float32))
+        ring.prepare_growth()
+        ring.write(np.arange(5, 8, dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.read(ring.read_idx), [2, 3, 4, 5, 6, 7])
+
+    def test_views_taken_before_swap_stay_valid(self):
+        ring = RingBuffer(4, max_capacity=16)
+        ring.write(np.arange(3, dtype=np.float32))
+        views = ring.views(0)
+        ring.prepare_growth()
+        ring.write(np.arange(3, 6, dtype=np.float32))
+
+        np.testing.assert_array_equal(np.concatenate(views), [0, 1, 2])
+
+    def test_write_without_room_never_allocates(self):
+        ring = RingBuffer(4, max_capacity=16)
+        buf = ring._buf
+        ring.write(np.arange(10, dtype=np.float32))
+
+        assert ring._buf is buf
+        assert ring.dropped == 6
+
+    def test_full_ring_keeps_oldest_and_counts_dropped(self):
+        ring = RingBuffer(4, max_capacity=8)
+        ring.write(np.arange(4, dtype=np.float32))
+        ring.prepare_growth()
+        ring.write(np.arange(4, 10, dtype=np.float32))
+        ring.write(np.arange(10, 12, dtype=np.float32))
+
+        assert ring.dropped == 4
+        np.testing.assert_array_equal(ring.read(0), np.arange(8))
+
+    def test_growth_while_consumer_reads(self):
+        block = 256
+        total = block * 400
+        ring = RingBuffer(1024, max_capacity=1 << 17)
+        done = threading.Event()
+
+        def produce():
+            for start in range(0, total, block):
+                ring.write(np.arange(start, start + block, dtype=np.float32))
+                time.sleep(0.0001)  # paced like an audio callback
+            done.set()
+            ring.grow_requested.set()
+
+        def grow():
+            while not done.is_set():
+                ring.grow_requested.wait()
+                ring.grow_requested.clear()
+                ring.prepare_growth()
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=grow)]
+        for t in threads:
+            t.start()
+
+        received = []
+        while not done.is_set() or ring.available:
+            stop = ring.write_idx
+            received.append(ring.read(ring.read_idx, stop))
+            ring.read_idx = stop
+            time.sleep(0.001)  # consumer lags, so the ring must grow
+        for t in threads:
+            t.join()
+
+        assert ring.capacity > 1024
+        assert ring.dropped == 0
+        np.testing.assert_array_equal(np.concatenate(received), np.arange(total))
+
+
+class TestAudioCaptureRing:
+    def test_callback_writes_first_channel_into_ring(self):
+        ring = RingBuffer(16)
+        cap = AudioCapture(ring=ring)
+        cap._is_recording = True
+
+        _feed(cap, np.array([[1.0, 9.0], [2.0, 9.0]], dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.read(0), [1.0, 2.0])
+
+    def test_live_callback_still_receives_chunks(self):
+        live = MagicMock()
+        cap = AudioCapture(ring=RingBuffer(16), callback=live)
+        cap._is_recording = True
+
+        _feed(cap, np.ones((4, 1), dtype=np.float32))
+
+        live.assert_called_once()
+
+    def test_ignored_when_not_recording(self):
+        ring = RingBuffer(16)
+        cap = AudioCapture(ring=ring)
+
+        _feed(cap, np.ones((4, 1), dtype=np.float32))
+
+        assert ring.write_idx == 0
+
+
+class TestRecorderBuffer:
+    def test_stop_returns_float32_mono(self):
+        rec = Recorder()
+        capture = _start(rec)
+        _feed(capture, np.ones((4, 1), dtype=np.float32))
+        _feed(capture, np.zeros((4, 1), dtype=np.float32))
+
+        audio = _stop(rec)
+
+        assert audio.dtype == np.float32
+        assert audio.shape == (8,)
+
+    def test_each_recording_returns_only_its_audio(self):
+        rec = Recorder()
+        _feed(_start(rec), np.ones((4, 1), dtype=np.float32))
+        _stop(rec)
+
+        _feed(_start(rec), np.zeros((2, 1), dtype=np.float32))
+        np.testing.assert_array_equal(_stop(rec), [0.0, 0.0])
+
+    def test_limit_keeps_start_and_flags_truncation(self):
+        rec = Recorder(sample_rate=4)
+        _feed_blocks(_start(rec), np.arange(4 * 700, dtype=np.float32), block=4)
+
+        audio = _stop(rec)
+
+        assert rec.truncated is True
+        assert len(audio) == 4 * Recorder.MAX_RECORDING_SECONDS
+        assert audio[0] == 0
+
+    def test_grown_ring_released_after_stop(self):
+        rec = Recorder(sample_rate=4)
+        _feed_blocks(_start(rec), np.zeros(4 * 60, dtype=np.float32), block=4)
+        _stop(rec)
+
+        assert rec._ring.capacity == 4 * Recorder.INITIAL_RECORDING_SECONDS
+        _start(rec)
+        assert rec.truncated is False
+
+    def test_stop_without_audio_returns_none(self):
+        rec = Recorder()
+        _start(rec)
+        assert _stop(rec) is None
+
+    def test_stop_when_not_started_returns_none(self):
+        assert Recorder().stop() is None
+
+
+class TestSlots:
+    def test_capture_classes_have_no_instance_dict(self):
+        for obj in (RingBuffer(4), AudioCapture(), Recorder(), SessionRecorder()):
+            assert not hasattr(obj, "__dict__")
+
+    def test_audio_chunk_has_no_instance_dict(self):
+        chunk = AudioChunk(data=np.zeros(4, dtype=np.float32), sample_rate=16000)
+        assert not hasattr(chunk, "__dict__")
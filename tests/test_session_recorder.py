@@ -18,6 +18,18 @@ from tommy_talker.engine.audio_capture import (
 from tommy_talker.utils.config import UserConfig, load_config, save_config
 
 
+def _written(mock_sf_instance) -> np.ndarray:
+    """Concatenate everything the writer thread passed to SoundFile.write."""
+    writes = [c[0][0] for c in mock_sf_instance.write.call_args_list]
+    return np.concatenate(writes) if writes else np.empty(0, dtype=np.float32)
+
+
+def _system_audio(rec: SessionRecorder, indata: np.ndarray):
+    """Deliver a PortAudio block through the system capture's callback."""
+    rec._system_capture._is_recording = True
+    rec._system_capture._audio_callback(indata, len(indata), None, None)
+
+
 # ── SessionRecorder Lifecycle ─────────────────────────────────
 
 
@@ -62,6 +74,42 @@ class TestSessionRecorderStart:
         assert path.suffix == ".wav"
         mock_sf.SoundFile.assert_called_once()
 
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    def test_captures_use_host_native_blocksize(self, mock_start, mock_sf, tmp_path):
+        mock_sf.SoundFile.return_value = MagicMock()
+        rec = SessionRecorder(source_mode="system_and_mic", system_device=5, output_dir=tmp_path)
+        rec.start()
+
+        assert rec._mic_capture.chunk_size == 0
+        assert rec._system_capture.chunk_size == 0
+
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    def test_system_capture_writes_ring_without_chunks(self, mock_start, mock_sf, tmp_path):
+        mock_sf.SoundFile.return_value = MagicMock()
+        rec = SessionRecorder(source_mode="system", system_device=5, output_dir=tmp_path)
+        rec.start()
+
+        assert rec._system_capture.ring is rec._system_ring
+        assert rec._system_capture.callback is None
+
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    def test_default_subtype_is_pcm16(self, mock_start, mock_sf, tmp_path):
+        mock_sf.SoundFile.return_value = MagicMock()
+        SessionRecorder(output_dir=tmp_path).start()
+
+        assert mock_sf.SoundFile.call_args[1]["subtype"] == "PCM_16"
+
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    def test_float_subtype_selectable(self, mock_start, mock_sf, tmp_path):
+        mock_sf.SoundFile.return_value = MagicMock()
+        SessionRecorder(output_dir=tmp_path, subtype="FLOAT").start()
+
+        assert mock_sf.SoundFile.call_args[1]["subtype"] == "FLOAT"
+
     @patch("tommy_talker.engine.audio_capture.sf")
     @patch.object(AudioCapture, "start")
     def test_filename_format(self, mock_start, mock_sf, tmp_path):
@@ -160,8 +208,6 @@ class TestMicMuting:
     @patch("tommy_talker.engine.audio_capture.sf")
     @patch.object(AudioCapture, "start")
     def test_muted_mic_writes_silence_in_single_mode(self, mock_start, mock_sf, tmp_path):
-        from datetime import datetime
-
         mock_sf_instance = MagicMock()
         mock_sf.SoundFile.return_value = mock_sf_instance
         rec = SessionRecorder(source_mode="mic", output_dir=tmp_path)
@@ -172,18 +218,17 @@ class TestMicMuting:
         chunk = AudioChunk(
             data=np.ones((1024, 1), dtype=np.float32),
             sample_rate=44100,
-            timestamp=datetime.now(),
         )
         rec._on_mic_chunk(chunk)
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
 
         # Muted in mic-only mode: should NOT write anything
-        mock_sf_instance.write.assert_not_called()
+        assert len(_written(mock_sf_instance)) == 0
 
     @patch("tommy_talker.engine.audio_capture.sf")
     @patch.object(AudioCapture, "start")
     def test_unmuted_mic_writes_data(self, mock_start, mock_sf, tmp_path):
-        from datetime import datetime
-
         mock_sf_instance = MagicMock()
         mock_sf.SoundFile.return_value = mock_sf_instance
         rec = SessionRecorder(source_mode="mic", output_dir=tmp_path)
@@ -192,11 +237,33 @@ class TestMicMuting:
         chunk = AudioChunk(
             data=np.ones((1024, 1), dtype=np.float32),
             sample_rate=44100,
-            timestamp=datetime.now(),
         )
         rec._on_mic_chunk(chunk)
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
+
+        assert len(_written(mock_sf_instance)) == 1024
+
+
+class TestBatchedWrites:
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    def test_partial_batch_stays_staged_until_stop(self, mock_start, mock_sf, tmp_path):
+        mock_sf_instance = MagicMock()
+        mock_sf.SoundFile.return_value = mock_sf_instance
+        rec = SessionRecorder(source_mode="mic", output_dir=tmp_path)
+        rec.start()
 
-        mock_sf_instance.write.assert_called_once()
+        rec._on_mic_chunk(AudioChunk(
+            data=np.ones((1024, 1), dtype=np.float32),
+            sample_rate=44100,
+        ))
+        rec._write_available()
+        mock_sf_instance.write.assert_not_called()
+
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
+        assert len(_written(mock_sf_instance)) == 1024
 
 
 # ── Dual Source Mixing ────────────────────────────────────────
@@ -206,8 +273,6 @@ class TestDualSourceMixing:
     @patch("tommy_talker.engine.audio_capture.sf")
     @patch.object(AudioCapture, "start")
     def test_flush_mixed_averages_chunks(self, mock_start, mock_sf, tmp_path):
-        from datetime import datetime
-
         mock_sf_instance = MagicMock()
         mock_sf.SoundFile.return_value = mock_sf_instance
         rec = SessionRecorder(
@@ -218,27 +283,25 @@ class TestDualSourceMixing:
         mic_chunk = AudioChunk(
             data=np.full((1024, 1), 0.4, dtype=np.float32),
             sample_rate=44100,
-            timestamp=datetime.now(),
         )
         sys_chunk = AudioChunk(
             data=np.full((1024, 1), 0.6, dtype=np.float32),
             sample_rate=44100,
-            timestamp=datetime.now(),
         )
 
         rec._on_mic_chunk(mic_chunk)
-        rec._on_system_chunk(sys_chunk)
+        _system_audio(rec, sys_chunk.data)
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
 
         # Should have written mixed audio
-        assert mock_sf_instance.write.call_count == 1
-        written_data = mock_sf_instance.write.call_args[0][0]
+        written_data = _written(mock_sf_instance)
+        assert len(written_data) == 1024
         np.testing.assert_allclose(written_data, 0.5, atol=1e-6)
 
     @patch("tommy_talker.engine.audio_capture.sf")
     @patch.object(AudioCapture, "start")
     def test_muted_mic_writes_silence_in_mix(self, mock_start, mock_sf, tmp_path):
-        from datetime import datetime
-
         mock_sf_instance = MagicMock()
         mock_sf.SoundFile.return_value = mock_sf_instance
         rec = SessionRecorder(
@@ -250,21 +313,63 @@ class TestDualSourceMixing:
         mic_chunk = AudioChunk(
             data=np.full((1024, 1), 1.0, dtype=np.float32),
             sample_rate=44100,
-            timestamp=datetime.now(),
         )
         sys_chunk = AudioChunk(
             data=np.full((1024, 1), 0.8, dtype=np.float32),
             sample_rate=44100,
-            timestamp=datetime.now(),
         )
 
         rec._on_mic_chunk(mic_chunk)
-        rec._on_system_chunk(sys_chunk)
+        _system_audio(rec, sys_chunk.data)
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
 
         # Mic muted → zeros + 0.8 = 0.4 average
-        written_data = mock_sf_instance.write.call_args[0][0]
+        written_data = _written(mock_sf_instance)
+        assert len(written_data) == 1024
         np.testing.assert_allclose(written_data, 0.4, atol=1e-6)
 
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    def test_unmatched_tail_waits_for_other_source(self, mock_start, mock_sf, tmp_path):
+        mock_sf_instance = MagicMock()
+        mock_sf.SoundFile.return_value = mock_sf_instance
+        rec = SessionRecorder(
+            source_mode="system_and_mic", system_device=5, output_dir=tmp_path
+        )
+        rec.start()
+
+        rec._on_mic_chunk(AudioChunk(
+            data=np.full((1024, 1), 0.2, dtype=np.float32),
+            sample_rate=44100,
+        ))
+        _system_audio(rec, np.full((512, 1), 0.2, dtype=np.float32))
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
+
+        # Only the overlapping 512 frames can be mixed
+        assert len(_written(mock_sf_instance)) == 512
+
+    @patch("tommy_talker.engine.audio_capture.sf")
+    @patch.object(AudioCapture, "start")
+    @patch.object(SessionRecorder, "RING_SECONDS", 1)
+    def test_lagging_writer_skips_overwritten_frames(self, mock_start, mock_sf, tmp_path):
+        mock_sf_instance = MagicMock()
+        mock_sf.SoundFile.return_value = mock_sf_instance
+        rec = SessionRecorder(
+            source_mode="system_and_mic", system_device=5, sample_rate=100, output_dir=tmp_path
+        )
+        rec.start()
+
+        # 250 frames into 100-frame rings: the oldest 150 are overwritten
+        ramp = np.arange(250, dtype=np.float32).reshape(-1, 1)
+        rec._on_mic_chunk(AudioChunk(data=ramp, sample_rate=100))
+        _system_audio(rec, ramp)
+        with patch.object(AudioCapture, "stop"):
+            rec.stop()
+
+        np.testing.assert_allclose(_written(mock_sf_instance), np.arange(150, 250))
+
 
 # ── AudioCapture Device Parameter ────────────────────────────
 
@@ -290,6 +395,11 @@ class TestAudioCaptureDevice:
         call_kwargs = mock_stream_cls.call_args[1]
         assert call_kwargs["device"] == 7
 
+    @patch("tommy_talker.engine.audio_capture.sd.InputStream")
+    def test_stream_requests_float32(self, mock_stream_cls):
+        AudioCapture().start()
+        assert mock_stream_cls.call_args[1]["dtype"] == "float32"
+
     @patch("tommy_talker.engine.audio_capture.sd.InputStream")
     def test_none_device_passed_as_none(self, mock_stream_cls):
         mock_stream = MagicMock()
@@ -314,6 +424,10 @@ class TestSessionConfig:
         config = UserConfig()
         assert config.session_system_device is None
 
+    def test_default_session_audio_subtype(self):
+        config = UserConfig()
+        assert config.session_audio_subtype == "PCM_16"
+
     def test_config_roundtrip(self, tmp_path, monkeypatch):
         monkeypatch.setattr(
             "tommy_talker.utils.config.BASE_DATA_DIR", tmp_path
@@ -322,9 +436,11 @@ class TestSessionConfig:
         config = UserConfig(
             session_audio_source="system_and_mic",
             session_system_device="BlackHole 2ch",
+            session_audio_subtype="FLOAT",
         )
         save_config(config)
 
         loaded = load_config()
         assert loaded.session_audio_source == "system_and_mic"
         assert loaded.session_system_device == "BlackHole 2ch"
+        assert loaded.session_audio_subtype == "FLOAT"
@@ -0,0 +1,95 @@
+"""
+Tests for the SetupGuideWindow permission wizard.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from PyQt6.QtCore import QEvent
+from PyQt6.QtWidgets import QLabel, QPushButton, QWidget
+
+from tommy_talker.gui.setup_guide import PERMISSION_POLL_MS, SetupGuideWindow
+from tommy_talker.utils.permissions import PermissionStatus
+
+GUIDE = "tommy_talker.gui.setup_guide"
+
+
+@pytest.fixture
+def guide(qapp):
+    window = SetupGuideWindow(PermissionStatus(microphone=False, accessibility=False))
+    yield window
+    window.check_timer.stop()
+    window.deleteLater()
+
+
+class TestPermissionChecks:
+    def test_fallback_poll_interval(self, guide):
+        assert guide.check_timer.interval() == PERMISSION_POLL_MS
+
+    def test_activation_triggers_check(self, guide):
+        with patch(f"{GUIDE}.check_microphone_permission", return_value=True), \
+             patch(f"{GUIDE}.check_accessibility_permission", return_value=True), \
+             patch.object(SetupGuideWindow, "isActiveWindow", return_value=True):
+            guide.changeEvent(QEvent(QEvent.Type.ActivationChange))
+
+        assert guide.continue_btn.isEnabled()
+        assert not guide.check_timer.isActive()
+
+    def test_deactivation_does_not_check(self, guide):
+        with patch(f"{GUIDE}.check_microphone_permission") as mock_mic, \
+             patch.object(SetupGuideWindow, "isActiveWindow", return_value=False):
+            guide.changeEvent(QEvent(QEvent.Type.ActivationChange))
+
+        mock_mic.assert_not_called()
+
+    def test_granted_permission_not_reprobed(self, guide):
+        guide.perm_status = PermissionStatus(microphone=True, accessibility=False)
+        with patch(f"{GUIDE}.check_microphone_permission") as mock_mic, \
+             patch(f"{GUIDE}.check_accessibility_permission", return_value=False) as mock_acc:
+            guide._check_permissions()
+
+        mock_mic.assert_not_called()
+        mock_acc.assert_called_once()
+
+    def test_already_granted_enables_continue_without_probing(self, guide):
+        guide.perm_status = PermissionStatus(microphone=True, accessibility=True)
+        with patch(f"{GUIDE}.check_microphone_permission") as mock_mic:
+            guide._check_permissions()
+
+        mock_mic.assert_not_called()
+        assert guide.continue_btn.isEnabled()
+        assert not guide.check_timer.isActive()
+
+    def test_reentrant_check_skipped(self, guide):
+        guide._checking = True
+        with patch(f"{GUIDE}.check_microphone_permission") as mock_mic:
+            guide._check_permissions()
+        mock_mic.assert_not_called()
+
+
+class TestStyling:
+    def test_single_window_stylesheet(self, guide):
+        assert guide.styleSheet()
+        styled = [w.objectName() for w in guide.findChildren(QWidget) if w.styleSheet()]
+        assert styled == []
+
+    def test_cards_use_object_names(self, guide):
+        assert guide.mic_card.frame.objectName() == "permissionCard"
+        assert guide.continue_btn.objectName() == "continueButton"
+
+
+class TestPermissionCards:
+    def test_granting_swaps_button_for_status(self, guide):
+        card = guide.mic_card
+        assert isinstance(card.status_widget, QPushButton)
+        assert "Grant" in card.body_label.text()
+
+        with patch(f"{GUIDE}.check_microphone_permission", return_value=True), \
+             patch(f"{GUIDE}.check_accessibility_permission", return_value=False):
+            guide._check_permissions()
+
+        assert isinstance(card.status_widget, QLabel)
+        assert card.status_widget.text() == "\u2705 Granted"
+        assert "Grant" not in card.body_label.text()
+        assert isinstance(guide.access_card.status_widget, QPushButton)